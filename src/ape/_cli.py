@@ -17,6 +17,7 @@ from ape.exceptions import Abort, ApeException, handle_ape_exception
 from ape.logging import logger
 
 _DIFFLIB_CUT_OFF = 0.6
+_NO_SUCH_COMMAND_PATTERN = re.compile(r"No such command '(.*)'\.")
 
 
 def display_config(ctx, param, value):
@@ -38,6 +39,12 @@ def display_config(ctx, param, value):
 class ApeCLI(click.MultiCommand):
     _CLI_GROUP_NAME = "ape_cli_subcommands"
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # NOTE: Newer versions of click set an (empty) `commands` dict here,
+        #   which would shadow the cached entry-point commands below.
+        self.__dict__.pop("commands", None)
+
     def format_commands(self, ctx, formatter) -> None:
         from ape.plugins._utils import PluginMetadataList
 
@@ -101,16 +108,13 @@ class ApeCLI(click.MultiCommand):
         if usage_error.message is None:
             raise usage_error
 
-        elif not (match := re.match("No such command '(.*)'.", usage_error.message)):
-            raise usage_error
-
-        groups = match.groups()
-        if len(groups) < 1:
+        elif not (match := _NO_SUCH_COMMAND_PATTERN.match(usage_error.message)):
             raise usage_error
 
-        bad_arg = groups[0]
+        bad_arg = match.group(1)
+        command_names = list(usage_error.ctx.command.commands)
         suggested_commands = difflib.get_close_matches(
-            bad_arg, list(usage_error.ctx.command.commands.keys()), cutoff=_DIFFLIB_CUT_OFF
+            bad_arg, command_names, cutoff=_DIFFLIB_CUT_OFF
         )
         if suggested_commands:
             if bad_arg not in suggested_commands:
@@ -122,22 +126,23 @@ class ApeCLI(click.MultiCommand):
 
     @cached_property
     def commands(self) -> dict:
-        _entry_points = entry_points()
         eps: Iterable
 
         try:
-            eps = _entry_points.select(group=self._CLI_GROUP_NAME)
-        except AttributeError:
+            # NOTE: Only the CLI group is selected, rather than building every group.
+            eps = entry_points(group=self._CLI_GROUP_NAME)
+        except TypeError:
             # Fallback for Python 3.9
             with catch_warnings():
                 simplefilter("ignore")
-                eps = _entry_points.get(self._CLI_GROUP_NAME, [])  # type: ignore
+                eps = entry_points().get(self._CLI_GROUP_NAME, [])  # type: ignore
 
         commands = {cmd.name.replace("_", "-").replace("ape-", ""): cmd.load for cmd in eps}
         return dict(sorted(commands.items()))
 
     def list_commands(self, ctx) -> list[str]:
-        return [k for k in self.commands]
+        # NOTE: Already sorted when cached.
+        return list(self.commands)
 
     def get_command(self, ctx, name) -> Optional[click.Command]:
         try:
@@ -9,11 +9,11 @@ import time
 import warnings
 from abc import abstractmethod
 from collections.abc import Iterable, Iterator
-from functools import cached_property
+from functools import cached_property, lru_cache
 from logging import FileHandler, Formatter, Logger, getLogger
 from pathlib import Path
 from signal import SIGINT, SIGTERM, signal
-from subprocess import DEVNULL, PIPE, Popen
+from subprocess import DEVNULL, PIPE, Popen, TimeoutExpired
 from typing import TYPE_CHECKING, Any, ClassVar, Optional, Union, cast
 
 from eth_utils import to_hex
@@ -28,7 +28,6 @@ from ape.exceptions import (
     QueryEngineError,
     RPCTimeoutError,
     SubprocessError,
-    SubprocessTimeoutError,
     VirtualMachineError,
 )
 from ape.logging import LogLevel, logger
@@ -41,12 +40,13 @@ from ape.utils.misc import (
     raises_not_implemented,
     to_int,
 )
-from ape.utils.process import JoinableQueue, spawn
+from ape.utils.process import spawn
 from ape.utils.rpc import RPCHeaders
 
 if TYPE_CHECKING:
     from eth_pydantic_types import HexBytes
     from ethpm_types.abi import EventABI
+    from requests import Session
 
     from ape.api.accounts import TestAccountAPI
     from ape.api.config import PluginConfig
@@ -56,6 +56,11 @@ if TYPE_CHECKING:
     from ape.types.vm import BlockID, ContractCode, SnapshotID
 
 
+# NOTE: Computed once; the platform does not change during the process.
+_IS_LINUX = platform.system() == "Linux"
+_IS_WINDOWS = platform.system() == "Windows"
+
+
 class BlockAPI(BaseInterfaceModel):
     """
     An abstract class representing a block and its attributes.
@@ -112,8 +117,12 @@ class BlockAPI(BaseInterfaceModel):
     @model_validator(mode="before")
     @classmethod
     def convert_parent_hash(cls, data):
-        parent_hash = data.get("parent_hash", data.get("parentHash")) or EMPTY_BYTES32
-        data["parentHash"] = parent_hash
+        # perf: Avoid evaluating both `.get()` calls (this runs for every block).
+        if "parent_hash" in data:
+            data["parentHash"] = data["parent_hash"] or EMPTY_BYTES32
+        else:
+            data["parentHash"] = data.get("parentHash") or EMPTY_BYTES32
+
         return data
 
     @model_validator(mode="wrap")
@@ -267,6 +276,37 @@ class ProviderAPI(BaseInterfaceModel):
         """
         return None
 
+    @cached_property
+    def http_session(self) -> "Session":
+        """
+        A ``requests.Session`` with pooled keep-alive connections, sized by
+        :attr:`~ape.api.providers.ProviderAPI.concurrency`. HTTP-based providers
+        should route their raw RPC requests through this session so the TCP
+        (and TLS) connection setup is shared across requests.
+        """
+        # NOTE: Imported here so this module loads lazier.
+        from requests import Session
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = Session()
+        # NOTE: Include the config, ecosystem, and network headers too (not just the provider's).
+        network = self.network
+        headers = self.network_manager.get_request_headers(
+            network.ecosystem.name, network.name, self.name
+        )
+        session.headers.update(headers)
+        adapter = HTTPAdapter(
+            pool_connections=self.concurrency,
+            pool_maxsize=self.concurrency * 4,
+            # NOTE: No connect retries; fail fast when polling a node that is not up yet.
+            max_retries=Retry(total=3, connect=0, backoff_factor=0.1),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        atexit.register(session.close)
+        return session
+
     @property
     def settings(self) -> "PluginConfig":
         """
@@ -346,6 +386,53 @@ class ProviderAPI(BaseInterfaceModel):
             :class:`~ape.types.ContractCode`: The contract bytecode.
         """
 
+    def get_codes(
+        self, addresses: Iterable["AddressType"], block_id: Optional["BlockID"] = None
+    ) -> list["ContractCode"]:
+        """
+        Get the bytecode of many contracts at once. Providers that support
+        batch requests (see :meth:`~ape.api.providers.ProviderAPI.send_batch`)
+        can fetch them all in a single round-trip.
+
+        Args:
+            addresses (Iterable[:class:`~ape.types.address.AddressType`]): The addresses.
+            block_id (Optional[:class:`~ape.types.BlockID`]): The block ID.
+
+        Returns:
+            list[:class:`~ape.types.ContractCode`]: The bytecode, in the same order.
+        """
+        return [self.get_code(address, block_id=block_id) for address in addresses]
+
+    def get_balances(
+        self, addresses: Iterable["AddressType"], block_id: Optional["BlockID"] = None
+    ) -> list[int]:
+        """
+        Get the balances of many accounts at once.
+
+        Args:
+            addresses (Iterable[:class:`~ape.types.address.AddressType`]): The addresses.
+            block_id (Optional[:class:`~ape.types.BlockID`]): The block ID.
+
+        Returns:
+            list[int]: The balances, in the same order.
+        """
+        return [self.get_balance(address, block_id=block_id) for address in addresses]
+
+    def get_nonces(
+        self, addresses: Iterable["AddressType"], block_id: Optional["BlockID"] = None
+    ) -> list[int]:
+        """
+        Get the nonces of many accounts at once.
+
+        Args:
+            addresses (Iterable[:class:`~ape.types.address.AddressType`]): The addresses.
+            block_id (Optional[:class:`~ape.types.BlockID`]): The block ID.
+
+        Returns:
+            list[int]: The nonces, in the same order.
+        """
+        return [self.get_nonce(address, block_id=block_id) for address in addresses]
+
     @property
     def network_choice(self) -> str:
         """
@@ -369,6 +456,18 @@ class ProviderAPI(BaseInterfaceModel):
         class-serializations.
         """
 
+    @raises_not_implemented
+    def send_batch(self, calls: list[tuple[str, list]]) -> list[Any]:  # type: ignore[empty-body]
+        """
+        Make many raw RPC requests in a single JSON-RPC batch request.
+
+        Args:
+            calls (list[tuple[str, list]]): Pairs of RPC method names and their parameters.
+
+        Returns:
+            list[Any]: The results, in the same order as the given calls.
+        """
+
     @raises_not_implemented
     def stream_request(  # type: ignore[empty-body]
         self, method: str, params: Iterable, iter_path: str = "result.item"
@@ -539,6 +638,29 @@ class ProviderAPI(BaseInterfaceModel):
             str: The result of the transaction call.
         """
 
+    def send_calls(
+        self,
+        txns: Iterable[TransactionAPI],
+        block_id: Optional["BlockID"] = None,
+        state: Optional[dict] = None,
+    ) -> list["HexBytes"]:
+        """
+        Execute many transaction calls at once. Providers that support
+        batch requests (see :meth:`~ape.api.providers.ProviderAPI.send_batch`)
+        can make them all in a single round-trip.
+
+        Args:
+            txns (Iterable[:class:`~ape.api.transactions.TransactionAPI`]): The calls.
+            block_id (Optional[:class:`~ape.types.BlockID`]): The block ID
+                to use to send the calls at a historical point.
+            state (Optional[dict]): Modify the state of the blockchain
+                prior to sending the calls, for testing purposes.
+
+        Returns:
+            list[HexBytes]: The results of the calls, in the same order.
+        """
+        return [self.send_call(txn, block_id=block_id, state=state) for txn in txns]
+
     @abstractmethod
     def get_receipt(self, txn_hash: str, **kwargs) -> ReceiptAPI:
         """
@@ -705,7 +827,9 @@ class ProviderAPI(BaseInterfaceModel):
 
     @log_instead_of_fail(default="<ProviderAPI>")
     def __repr__(self) -> str:
-        return f"<{self.name.capitalize()} chain_id={self.chain_id}>"
+        name = self.name.capitalize()
+        chain_id = self.chain_id
+        return f"<{name} chain_id={chain_id}>" if chain_id is not None else f"<{name}>"
 
     @raises_not_implemented
     def set_code(  # type: ignore[empty-body]
@@ -987,8 +1111,7 @@ class SubprocessProvider(ProviderAPI):
     process: Optional[Popen] = None
     is_stopping: bool = False
 
-    stdout_queue: Optional[JoinableQueue] = None
-    stderr_queue: Optional[JoinableQueue] = None
+    _signals_installed: ClassVar[bool] = False
 
     @property
     @abstractmethod
@@ -1059,15 +1182,16 @@ class SubprocessProvider(ProviderAPI):
             or self.config_manager.get_config("test").disconnect_providers_after
         )
         if disconnect_after:
+            # NOTE: Unregister first so reconnecting does not stack handlers.
+            atexit.unregister(self.disconnect)
             atexit.register(self.disconnect)
 
         # Register handlers to ensure atexit handlers are called when Python dies.
-        def _signal_handler(signum, frame):
-            atexit._run_exitfuncs()
-            sys.exit(143 if signum == SIGTERM else 130)
-
-        signal(SIGINT, _signal_handler)
-        signal(SIGTERM, _signal_handler)
+        # NOTE: Only done once; the handler is the same for all providers.
+        if not SubprocessProvider._signals_installed:
+            signal(SIGINT, _signal_handler)
+            signal(SIGTERM, _signal_handler)
+            SubprocessProvider._signals_installed = True
 
     def disconnect(self):
         """
@@ -1075,6 +1199,7 @@ class SubprocessProvider(ProviderAPI):
         Subclasses override this method to do provider-specific disconnection tasks.
         """
 
+        atexit.unregister(self.disconnect)
         if self.process:
             self.stop()
 
@@ -1086,77 +1211,47 @@ class SubprocessProvider(ProviderAPI):
             self.process = None  # Not managing the process.
         else:
             logger.info(f"Starting '{self.process_name}' process.")
-            pre_exec_fn = _linux_set_death_signal if platform.uname().system == "Linux" else None
-            self.stderr_queue = JoinableQueue()
-            self.stdout_queue = JoinableQueue()
+            pre_exec_fn = _linux_set_death_signal if _IS_LINUX else None
             out_file = PIPE if logger.level <= LogLevel.DEBUG else DEVNULL
             cmd = self.build_command()
             self.process = Popen(cmd, preexec_fn=pre_exec_fn, stdout=out_file, stderr=out_file)
-            spawn(self.produce_stdout_queue)
-            spawn(self.produce_stderr_queue)
-            spawn(self.consume_stdout_queue)
-            spawn(self.consume_stderr_queue)
+            if out_file is PIPE:
+                # NOTE: Output goes to DEVNULL otherwise; nothing to read.
+                spawn(self._pump_stream, self.process.stdout, self._stdout_logger)
+                spawn(self._pump_stream, self.process.stderr, self._stderr_logger)
 
             with RPCTimeoutError(self, seconds=timeout) as _timeout:
+                # NOTE: Back off exponentially so that fast-starting processes
+                #   are detected quickly without busy-polling slow ones.
+                wait_time = 0.005
                 while True:
                     if self.is_connected:
                         break
 
-                    time.sleep(0.1)
+                    time.sleep(wait_time)
+                    wait_time = min(wait_time * 2, 0.1)
                     _timeout.check()
 
-    def produce_stdout_queue(self):
-        process = self.process
-        if self.stdout_queue is None or process is None:
-            return
-
-        stdout = process.stdout
-        if stdout is None:
-            return
-
-        for line in iter(stdout.readline, b""):
-            self.stdout_queue.put(line)
-            time.sleep(0)
-
-    def produce_stderr_queue(self):
-        process = self.process
-        if self.stderr_queue is None or process is None:
-            return
-
-        stderr = process.stderr
-        if stderr is None:
-            return
-
-        for line in iter(stderr.readline, b""):
-            self.stderr_queue.put(line)
-            time.sleep(0)
-
-    def consume_stdout_queue(self):
-        if self.stdout_queue is None:
-            return
-
-        for line in self.stdout_queue:
-            output = line.decode("utf8").strip()
-            logger.debug(output)
-            self._stdout_logger.debug(output)
-
-            if self.stdout_queue is not None:
-                self.stdout_queue.task_done()
-
-            time.sleep(0)
-
-    def consume_stderr_queue(self):
-        if self.stderr_queue is None:
+    def _pump_stream(self, stream, file_logger: Logger):
+        """
+        Read the given process output stream line-by-line and send each line
+        to both Ape's logger and the given file logger.
+        """
+        if stream is None:
             return
 
-        for line in self.stderr_queue:
-            logger.debug(line.decode("utf8").strip())
-            self._stdout_logger.debug(line)
-
-            if self.stderr_queue is not None:
-                self.stderr_queue.task_done()
+        for line in iter(stream.readline, b""):
+            debug_on = logger.level <= LogLevel.DEBUG
+            file_on = file_logger.isEnabledFor(logging.DEBUG)
+            if not debug_on and not file_on:
+                # perf: Avoid decoding lines no one will see.
+                continue
 
-            time.sleep(0)
+            output = line.decode("utf8", "replace").rstrip()
+            if debug_on:
+                logger.debug(output)
+            if file_on:
+                file_logger.debug(output)
 
     def stop(self):
         """Kill the process."""
@@ -1176,16 +1271,12 @@ class SubprocessProvider(ProviderAPI):
             raise SubprocessError("Unable to wait for process. It is not set yet.")
 
         try:
-            with SubprocessTimeoutError(self, seconds=timeout) as _timeout:
-                while self.process.poll() is None:
-                    time.sleep(0.1)
-                    _timeout.check()
-
-        except SubprocessTimeoutError:
+            self.process.wait(timeout=timeout)
+        except TimeoutExpired:
             pass
 
     def _kill_process(self):
-        if platform.uname().system == "Windows":
+        if _IS_WINDOWS:
             self._windows_taskkill()
             return
 
@@ -1224,7 +1315,7 @@ class SubprocessProvider(ProviderAPI):
         if not process:
             return
 
-        taskkill_bin = shutil.which("taskkill")
+        taskkill_bin = _get_taskkill_bin()
         if not taskkill_bin:
             raise SubprocessError("Could not find taskkill.exe executable.")
 
@@ -1240,6 +1331,17 @@ class SubprocessProvider(ProviderAPI):
         proc.wait(timeout=self.PROCESS_WAIT_TIMEOUT)
 
 
+def _signal_handler(signum, frame):
+    atexit._run_exitfuncs()
+    sys.exit(143 if signum == SIGTERM else 130)
+
+
+@lru_cache(maxsize=1)
+def _get_taskkill_bin() -> Optional[str]:
+    # NOTE: Cached to avoid walking $PATH on every process kill.
+    return shutil.which("taskkill")
+
+
 def _linux_set_death_signal():
     """
     Automatically sends SIGTERM to child subprocesses when parent process
@@ -3,14 +3,13 @@ import time
 from abc import abstractmethod
 from collections.abc import Iterator
 from datetime import datetime as datetime_type
-from functools import cached_property
+from functools import cached_property, lru_cache
 from typing import IO, TYPE_CHECKING, Any, NoReturn, Optional, Union
 
 from eth_pydantic_types import HexBytes, HexStr
 from eth_utils import is_hex, to_hex, to_int
 from pydantic import ConfigDict, field_validator
 from pydantic.fields import Field
-from tqdm import tqdm  # type: ignore
 
 from ape.exceptions import (
     NetworkError,
@@ -19,7 +18,7 @@ from ape.exceptions import (
     TransactionError,
     TransactionNotFoundError,
 )
-from ape.logging import logger
+from ape.logging import LogLevel, logger
 from ape.types.address import AddressType
 from ape.types.basic import HexInt
 from ape.types.gas import AutoGasLimit
@@ -38,6 +37,18 @@ if TYPE_CHECKING:
     from ape.types.trace import SourceTraceback
 
 
+@lru_cache(maxsize=None)
+def _get_keys_before_data(cls: type["TransactionAPI"]) -> frozenset[str]:
+    keys = set()
+    for name, field in cls.model_fields.items():
+        if name == "data":
+            break
+
+        keys.add(field.alias or name)
+
+    return frozenset(keys)
+
+
 class TransactionAPI(BaseInterfaceModel):
     """
     An API class representing a transaction.
@@ -184,29 +195,33 @@ class TransactionAPI(BaseInterfaceModel):
 
     def __str__(self) -> str:
         # NOTE: Using JSON mode for style.
-        data = self.model_dump(mode="json")
-        if len(data["data"]) > 9:
-            # only want to specify encoding if data["data"] is a string
-            if isinstance(data["data"], str):
-                data["data"] = (
-                    "0x"
-                    + bytes(data["data"][:3], encoding="utf8").hex()
-                    + "..."
-                    + bytes(data["data"][-3:], encoding="utf8").hex()
-                )
-            else:
-                data["data"] = (
-                    to_hex(bytes(data["data"][:3])) + "..." + to_hex(bytes(data["data"][-3:]))
-                )
-        else:
-            if isinstance(data["data"], str):
-                data["data"] = to_hex(bytes(data["data"], encoding="utf8"))
-            else:
-                data["data"] = to_hex(bytes(data["data"]))
+        # perf: Leave `data` out of the dump; only a few of its bytes are shown and
+        #   hex-encoding all of it (e.g. deployment bytecode) dominated the cost.
+        data = self.model_dump(mode="json", exclude={"data"})
+
+        # Show `data` in its declared position, same as the full dump.
+        leading_keys = _get_keys_before_data(type(self))
+        items = list(data.items())
+        index = sum(1 for key, _ in items if key in leading_keys)
+        items.insert(index, ("data", self._data_str))
+        data = dict(items)
+
         params = "\n  ".join(f"{k}: {v}" for k, v in data.items())
         cls_name = getattr(type(self), "__name__", TransactionAPI.__name__)
         return f"{cls_name}:\n  {params}"
 
+    @property
+    def _data_str(self) -> str:
+        # NOTE: Mirrors formatting the JSON-mode hex-str of `data`, reading only
+        #   the bytes needed for the head and tail.
+        data = memoryview(self.data)
+        if len(data) < 4:
+            return "0x" + f"0x{data.hex()}".encode("utf8").hex()
+
+        head = f"0x{data[:1].hex()[:1]}"
+        tail = data[-2:].hex()[-3:]
+        return f"0x{head.encode('utf8').hex()}...{tail.encode('utf8').hex()}"
+
 
 class ConfirmationsProgressBar:
     """
@@ -214,6 +229,9 @@ class ConfirmationsProgressBar:
     """
 
     def __init__(self, confirmations: int):
+        # perf: Only import tqdm when confirmations are actually awaited.
+        from tqdm import tqdm  # type: ignore
+
         self._req_confs = confirmations
         self._bar = tqdm(range(confirmations))
         self._confs = 0
@@ -371,11 +389,11 @@ class ReceiptAPI(ExtraAttributesMixin, BaseInterfaceModel):
         """
         return self.provider.get_transaction_trace(self.txn_hash)
 
-    @property
+    @cached_property
     def _explorer(self) -> Optional["ExplorerAPI"]:
         return self.provider.network.explorer
 
-    @property
+    @cached_property
     def _block_time(self) -> int:
         return self.provider.network.block_time
 
@@ -453,14 +471,18 @@ class ReceiptAPI(ExtraAttributesMixin, BaseInterfaceModel):
         if not self.sender:
             return
 
-        iterations_timeout = 20
-        iteration = 0
+        timeout = 20
+        deadline = time.monotonic() + timeout
+        # perf: Back off exponentially so a quick nonce update is noticed sooner
+        #   and slow ones cost fewer RPC calls.
+        delay = 0.25
+        max_delay = max(self._block_time / 2, 1)
         sender_nonce = self.provider.get_nonce(self.sender)
         while sender_nonce == self.nonce:
-            time.sleep(1)
+            time.sleep(delay)
+            delay = min(delay * 2, max_delay)
             sender_nonce = self.provider.get_nonce(self.sender)
-            iteration += 1
-            if iteration != iterations_timeout:
+            if time.monotonic() < deadline:
                 continue
 
             tx_err = TransactionError("Timeout waiting for sender's nonce to increase.")
@@ -471,6 +493,11 @@ class ReceiptAPI(ExtraAttributesMixin, BaseInterfaceModel):
                 break
 
     def _log_submission(self):
+        if logger.level > LogLevel.INFO:
+            # perf: Don't build the explorer URL (some explorers make requests for it)
+            #   when the message is not going to be shown.
+            return
+
         if explorer_url := self._explorer and self._explorer.get_transaction_url(self.txn_hash):
             log_message = f"Submitted {explorer_url}"
         else:
@@ -601,7 +628,11 @@ class ReceiptAPI(ExtraAttributesMixin, BaseInterfaceModel):
             return
 
         tracker = self._test_runner.coverage_tracker
-        if self.provider.supports_tracing and (traceback := self.source_traceback):
+        if not tracker.enabled:
+            # perf: Don't build the source traceback for nothing.
+            return
+
+        elif self.provider.supports_tracing and (traceback := self.source_traceback):
             if len(traceback) > 0:
                 tracker.cover(traceback)
 
@@ -14,9 +14,10 @@ if TYPE_CHECKING:
     from ethpm_types.abi import MethodABI
     from ethpm_types.source import ContractSource
 
+    from ape.api.compiler import CompilerAPI
     from ape.managers.project import ProjectManager
     from ape.pytest.config import ConfigWrapper
-    from ape.types.coverage import CoverageReport
+    from ape.types.coverage import CoverageReport, CoverageStatement, FunctionCoverage
     from ape.types.trace import ContractFunctionPath, ControlFlow, SourceTraceback
 
 
@@ -32,6 +33,15 @@ class CoverageData(ManagerAccessMixin):
         ] = sources
         self._report: Optional["CoverageReport"] = None
 
+        # perf: `cover()` is called for every control-flow in every traceback,
+        #   mostly with the same few source paths.
+        self._source_ids: dict[Path, str] = {}
+
+        # source_id -> pc -> [(function, statements containing the pc), ...]
+        self._pc_indices: Optional[
+            dict[str, dict[int, list[tuple["FunctionCoverage", tuple["CoverageStatement", ...]]]]]
+        ] = None
+
     @property
     def sources(self) -> list["ContractSource"]:
         if isinstance(self._sources, list):
@@ -48,11 +58,13 @@ class CoverageData(ManagerAccessMixin):
     def report(self) -> "CoverageReport":
         if self._report is None:
             self._report = self._init_coverage_profile()
+            self._pc_indices = None
 
         return self._report
 
     def reset(self):
         self._report = None
+        self._pc_indices = None
         self._init_coverage_profile()
 
     def _init_coverage_profile(
@@ -63,13 +75,21 @@ class CoverageData(ManagerAccessMixin):
         # source_id -> pc(s) -> times hit
         project_coverage = CoverageProject(name=self.project.name or "__local__")
 
+        registered_compilers = self.compiler_manager.registered_compilers
+
+        # perf: Sources with many contracts appear once per contract. Only resolve
+        #   their extension (which checks the file system) and compiler once.
+        compilers: dict[str, Optional["CompilerAPI"]] = {}
+
         for src in self.sources:
             source_cov = project_coverage.include(src)
-            ext = get_full_extension(Path(src.source_id))
-            if ext not in self.compiler_manager.registered_compilers:
+            if src.source_id not in compilers:
+                ext = get_full_extension(Path(src.source_id))
+                compilers[src.source_id] = registered_compilers.get(ext)
+
+            if not (compiler := compilers[src.source_id]):
                 continue
 
-            compiler = self.compiler_manager.registered_compilers[ext]
             try:
                 compiler.init_coverage_profile(source_cov, src)
             except NotImplementedError:
@@ -88,15 +108,49 @@ class CoverageData(ManagerAccessMixin):
 
         return report
 
+    def _get_pc_indices(
+        self,
+    ) -> dict[str, dict[int, list[tuple["FunctionCoverage", tuple["CoverageStatement", ...]]]]]:
+        # perf: Index every source's statements by PC once per report so covering
+        #   a PC is a dict lookup rather than a scan of every statement.
+        # NOTE: Access the report first; re-creating it clears the stale index.
+        report = self.report
+        if self._pc_indices is not None:
+            return self._pc_indices
+
+        pc_indices: dict[
+            str, dict[int, list[tuple["FunctionCoverage", tuple["CoverageStatement", ...]]]]
+        ] = {}
+        for project in report.projects:
+            for source_coverage in project.sources:
+                pc_index = pc_indices.setdefault(source_coverage.source_id, {})
+                for contract in source_coverage.contracts:
+                    for function in contract.functions:
+                        statements_by_pc: dict[int, list["CoverageStatement"]] = {}
+                        for statement in function.statements:
+                            for pc in statement.pcs:
+                                statements_by_pc.setdefault(pc, []).append(statement)
+
+                        # NOTE: Stored as tuples; the index is read-only once built
+                        #   and tuples are smaller than the appended-to lists.
+                        for pc, statements in statements_by_pc.items():
+                            pc_index.setdefault(pc, []).append((function, tuple(statements)))
+
+        self._pc_indices = pc_indices
+        return pc_indices
+
     def cover(
         self, src_path: Path, pcs: Iterable[int], inc_fn_hits: bool = True
     ) -> tuple[set[int], list[str]]:
-        if hasattr(self.project, "path"):
-            source_id = f"{src_path.relative_to(self.project.path)}"
-        else:
-            source_id = str(src_path)
+        if (source_id := self._source_ids.get(src_path)) is None:
+            if hasattr(self.project, "path"):
+                source_id = f"{src_path.relative_to(self.project.path)}"
+            else:
+                source_id = str(src_path)
+
+            self._source_ids[src_path] = source_id
 
-        if source_id not in self.report.sources:
+        if (pc_index := self._get_pc_indices().get(source_id)) is None:
             # The source is not tracked for coverage.
             return set(), []
 
@@ -106,31 +160,26 @@ class CoverageData(ManagerAccessMixin):
             if pc < 0:
                 continue
 
-            if not (source_coverage := self.report.get_source_coverage(source_id)):
-                continue
-
-            for contract in source_coverage.contracts:
-                for function in contract.functions:
-                    statements_hit = []
-                    for statement in function.statements:
-                        if statement in statements_hit or pc not in statement.pcs:
-                            # With 1 group of PCs, can only hit a statement once.
-                            # This is because likely multiple PCs together have the same
-                            # location and are really the same statement.
-                            # To increase the hit count by more than one, submit multiple txns.
-                            continue
+            for function, statements in pc_index.get(pc, ()):
+                statements_hit = []
+                for statement in statements:
+                    if statement in statements_hit:
+                        # With 1 group of PCs, can only hit a statement once.
+                        # This is because likely multiple PCs together have the same
+                        # location and are really the same statement.
+                        # To increase the hit count by more than one, submit multiple txns.
+                        continue
 
-                        statement.hit_count += 1
-                        handled_pcs.add(pc)
-                        statements_hit.append(statement)
+                    statement.hit_count += 1
+                    handled_pcs.add(pc)
+                    statements_hit.append(statement)
 
-                        # Increment this function's hit count if we haven't already.
-                        if inc_fn_hits and (
-                            not functions_incremented
-                            or function.full_name != functions_incremented[-1]
-                        ):
-                            function.hit_count += 1
-                            functions_incremented.append(function.full_name)
+                    # Increment this function's hit count if we haven't already.
+                    if inc_fn_hits and (
+                        not functions_incremented or function.full_name != functions_incremented[-1]
+                    ):
+                        function.hit_count += 1
+                        functions_incremented.append(function.full_name)
 
         unhandled_pcs = set(pcs) - handled_pcs
         if unhandled_pcs:
@@ -161,6 +210,9 @@ class CoverageTracker(ManagerAccessMixin):
         # Data gets initialized lazily (if coverage is needed).
         self._data: Optional[CoverageData] = None
 
+        # source_id -> absolute path, for matching sources to tracebacks.
+        self._source_paths: dict[str, Path] = {}
+
     @property
     def data(self) -> Optional[CoverageData]:
         if not self.enabled:
@@ -205,7 +257,7 @@ class CoverageTracker(ManagerAccessMixin):
               to ensure its hit count is bumped, even when there are not statements
               found. This is the only way to bump hit counts for auto-getters.
         """
-        if not self.data:
+        if not (data := self.data):
             return
 
         last_path: Optional[Path] = None
@@ -219,13 +271,20 @@ class CoverageTracker(ManagerAccessMixin):
         elif contract and function:
             # Make sure it is the actual source.
             source_path = traceback[0].source_path if len(traceback) > 0 else None
-            for project in self.data.report.projects:
+            project_path = self._project.path
+            for project in data.report.projects:
                 for src in project.sources:
                     # NOTE: We will allow this check to skip if there is no source is the
                     # traceback. This helps increment methods that are missing from the source map.
-                    path = self._project.path / src.source_id
-                    if source_path is not None and path != source_path:
-                        continue
+                    if source_path is not None:
+                        # perf: Runs for every source on every covered call; don't rebuild
+                        #   the same paths each time.
+                        if (path := self._source_paths.get(src.source_id)) is None:
+                            path = project_path / src.source_id
+                            self._source_paths[src.source_id] = path
+
+                        if path != source_path:
+                            continue
 
                     # Source containing the auto-getter found.
                     for con in src.contracts:
@@ -269,7 +328,7 @@ class CoverageTracker(ManagerAccessMixin):
         last_pcs: Optional[set[int]] = None,
         last_call: Optional[str] = None,
     ) -> tuple[set[int], list[str]]:
-        if not self.data or control_flow.source_path is None:
+        if not (data := self.data) or control_flow.source_path is None:
             return set(), []
 
         last_pcs = last_pcs or set()
@@ -284,7 +343,7 @@ class CoverageTracker(ManagerAccessMixin):
             new_pcs = pcs
 
         inc_fn = last_call is None or last_call != control_flow.closure.full_name
-        return self.data.cover(control_flow.source_path, new_pcs, inc_fn_hits=inc_fn)
+        return data.cover(control_flow.source_path, new_pcs, inc_fn_hits=inc_fn)
 
     def hit_function(self, contract_source: "ContractSource", method: "MethodABI"):
         """
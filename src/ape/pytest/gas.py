@@ -1,7 +1,5 @@
 from typing import TYPE_CHECKING, Optional
 
-from evm_trace.gas import merge_reports
-
 from ape.utils.basemodel import ManagerAccessMixin
 from ape.utils.trace import _exclude_gas, parse_gas_table
 
@@ -57,6 +55,17 @@ class GasTracker(ManagerAccessMixin):
         ):
             self._merge({contract_id: {method.selector: [gas_cost]}})
 
-    def _merge(self, report: dict):
-        session_report = self.session_gas_report or {}
-        self.session_gas_report = merge_reports(session_report, report)
+    def _merge(self, report: "GasReport"):
+        # perf: Merge in-place. `merge_reports()` deep-copied the whole session
+        #   report on every transaction, making a test session quadratic.
+        if self.session_gas_report is None:
+            self.session_gas_report = {}
+
+        _merge_into(self.session_gas_report, report)
+
+
+def _merge_into(dst: "GasReport", src: "GasReport"):
+    for contract_id, methods in src.items():
+        dst_methods = dst.setdefault(contract_id, {})
+        for method_id, gas_costs in methods.items():
+            dst_methods.setdefault(method_id, []).extend(gas_costs)
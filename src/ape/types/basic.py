@@ -5,8 +5,9 @@ from pydantic import BeforeValidator
 
 
 def _hex_int_validator(value, info):
-    if value is None:
+    if value is None or type(value) is int:
         # If not optional, will allow pydantic to (better) handle the error.
+        # perf: Ints (the common case, e.g. from web3.py) need no conversion.
         return value
 
     # NOTE: Allows this module to load lazier.
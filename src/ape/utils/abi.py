@@ -1,17 +1,17 @@
 import re
 from collections.abc import Sequence
 from dataclasses import make_dataclass
-from typing import Any, Optional, Union
+from functools import lru_cache
+from typing import Any, Callable, Optional, Union
 
 from eth_abi import grammar
-from eth_abi.abi import decode
-from eth_abi.decoding import UnsignedIntegerDecoder
+from eth_abi.decoding import ContextFramesBytesIO, TupleDecoder, UnsignedIntegerDecoder
 from eth_abi.encoding import UnsignedIntegerEncoder
 from eth_abi.exceptions import DecodingError, InsufficientDataBytes
 from eth_abi.registry import BaseEquals, registry
 from eth_pydantic_types import HexBytes, HexStr
 from eth_pydantic_types.validators import validate_bytes_size
-from eth_utils import decode_hex
+from eth_utils import decode_hex, to_normalized_address
 from ethpm_types.abi import ABIType, ConstructorABI, EventABI, EventABIType, MethodABI
 
 from ape.logging import logger
@@ -52,6 +52,30 @@ registry.register(
 )
 
 
+@lru_cache(maxsize=1024)
+def _get_tuple_decoder(types: tuple[str, ...], strict: bool) -> TupleDecoder:
+    decoders = [registry.get_decoder(abi_type, strict=strict) for abi_type in types]
+    return TupleDecoder(decoders=decoders)
+
+
+def decode_abi(types: Sequence[str], data: bytes, strict: bool = True) -> tuple:
+    """
+    Decode ABI-encoded data, the same as ``eth_abi.decode()``, except the
+    decoder for each list of types is re-used rather than built on every call.
+
+    Args:
+        types (Sequence[str]): The canonical ABI types to decode.
+        data (bytes): The ABI-encoded data.
+        strict (bool): Set to ``False`` to ignore padding validations
+          (like the Solidity ABI decoder). Defaults to ``True``.
+
+    Returns:
+        tuple: The decoded values.
+    """
+    decoder = _get_tuple_decoder(tuple(types), strict)
+    return decoder(ContextFramesBytesIO(data))
+
+
 def is_array(abi_type: Union[str, ABIType]) -> bool:
     """
     Returns ``True`` if the given type is a probably an array.
@@ -441,6 +465,67 @@ def is_dynamic_sized_type(abi_type: Union[ABIType, str]) -> bool:
     return parsed.is_dynamic
 
 
+def _get_word_decoder(abi_type: str) -> Optional[Callable[[bytes], Any]]:
+    """
+    Get a decoder for a static type that fits in a single 32-byte ABI word,
+    or ``None`` when the type requires the full ``eth_abi`` decoder.
+    The decoders raise ``ValueError`` for padding ``eth_abi`` would reject.
+    """
+
+    def decode_address(word: bytes) -> str:
+        if any(word[:12]):
+            raise ValueError(abi_type)
+
+        return to_normalized_address(word[12:])
+
+    def decode_bool(word: bytes) -> bool:
+        value = int.from_bytes(word, "big")
+        if value > 1:
+            raise ValueError(abi_type)
+
+        return bool(value)
+
+    def decode_uint(word: bytes) -> int:
+        value = int.from_bytes(word, "big")
+        if value >> bit_size:
+            raise ValueError(abi_type)
+
+        return value
+
+    def decode_int(word: bytes) -> int:
+        value = int.from_bytes(word, "big", signed=True)
+        if not -bound <= value < bound:
+            raise ValueError(abi_type)
+
+        return value
+
+    def decode_bytes(word: bytes) -> bytes:
+        if any(word[byte_size:]):
+            raise ValueError(abi_type)
+
+        return word[:byte_size]
+
+    if abi_type == "address":
+        return decode_address
+
+    elif abi_type == "bool":
+        return decode_bool
+
+    elif abi_type.startswith("uint") and abi_type[4:].isnumeric():
+        bit_size = int(abi_type[4:])
+        return decode_uint
+
+    elif abi_type.startswith("int") and abi_type[3:].isnumeric():
+        bound = 1 << (int(abi_type[3:]) - 1)
+        return decode_int
+
+    elif abi_type.startswith("bytes") and abi_type[5:].isnumeric():
+        byte_size = int(abi_type[5:])
+        return decode_bytes
+
+    return None
+
+
 class LogInputABICollection:
     def __init__(self, abi: EventABI):
         self.abi = abi
@@ -451,6 +536,21 @@ class LogInputABICollection:
         if len(set(names)) < len(names):
             raise ValueError("duplicate names found in log input", abi)
 
+        # perf: Events made of only single-word static types (e.g. Transfer) are
+        #   decoded by slicing the raw words, skipping the eth_abi stream decoders.
+        word_types = [
+            (i.name, "bytes32" if is_dynamic_sized_type(i.type) else i.canonical_type)
+            for i in self.topic_abi_types
+        ] + [(i.name, i.canonical_type) for i in self.data_abi_types]
+        word_decoders: list[tuple[Optional[str], str, Callable[[bytes], Any]]] = []
+        for name, abi_type in word_types:
+            if not (decode_word := _get_word_decoder(abi_type)):
+                break
+
+            word_decoders.append((name, abi_type, decode_word))
+
+        self._word_decoders = word_decoders if len(word_decoders) == len(word_types) else None
+
     @property
     def event_name(self):
         return self.abi.name
@@ -458,6 +558,9 @@ class LogInputABICollection:
     def decode(
         self, topics: list[str], data: Union[str, bytes], use_hex_on_fail: bool = False
     ) -> dict:
+        if self._word_decoders is not None and (decoded_words := self._decode_words(topics, data)):
+            return decoded_words
+
         decoded = {}
         for abi, topic_value in zip(self.topic_abi_types, topics[1:]):
             # reference types as indexed arguments are written as a hash
@@ -466,7 +569,7 @@ class LogInputABICollection:
             hex_value = decode_hex(topic_value)
 
             try:
-                value = decode([abi_type], hex_value, strict=False)[0]
+                value = decode_abi([abi_type], hex_value, strict=False)[0]
             except InsufficientDataBytes as err:
                 if use_hex_on_fail:
                     if abi.name not in decoded:
@@ -484,13 +587,13 @@ class LogInputABICollection:
         data_abi_types = [abi.canonical_type for abi in self.data_abi_types]
         hex_data = decode_hex(data) if isinstance(data, str) else data
         try:
-            data_values = decode(data_abi_types, hex_data)
+            data_values = decode_abi(data_abi_types, hex_data)
         except InsufficientDataBytes as err:
             warning_message = f"Failed to decode log data '{self.event_name}'."
 
             # Try again with strict=False
             try:
-                data_values = decode(data_abi_types, hex_data, strict=False)
+                data_values = decode_abi(data_abi_types, hex_data, strict=False)
             except Exception:
                 # Even with strict=False, we failed to decode.
                 # This should be a rare occasion, if it ever happens.
@@ -521,6 +624,33 @@ class LogInputABICollection:
 
         return decoded
 
+    def _decode_words(self, topics: list[str], data: Union[str, bytes]) -> Optional[dict]:
+        # NOTE: Returns ``None`` when the log is not well-formed, so that the
+        #   regular decoder can handle (or report) it.
+        hex_data = decode_hex(data) if isinstance(data, str) else data
+        topic_count = len(self.topic_abi_types) + 1
+        if len(topics) != topic_count or len(hex_data) != 32 * len(self.data_abi_types):
+            return None
+
+        words = [decode_hex(t) if isinstance(t, str) else t for t in topics[1:]]
+        for start in range(0, len(hex_data), 32):
+            end = start + 32
+            words.append(hex_data[start:end])
+
+        decoded = {}
+        for (name, abi_type, decode_word), word in zip(self._word_decoders or [], words):
+            if len(word) != 32:
+                return None
+
+            try:
+                value = decode_word(word)
+            except ValueError:
+                return None
+
+            decoded[name] = self.decode_value(abi_type, value)
+
+        return decoded
+
     def decode_value(self, abi_type: str, value: Any) -> Any:
         if abi_type == "bytes32":
             return HexBytes(value)
@@ -3,6 +3,8 @@ import functools
 import inspect
 import json
 import sys
+import threading
+import weakref
 
 if sys.version_info.minor >= 11:
     # 3.11 or greater
@@ -357,6 +359,20 @@ def to_int(value: Any) -> int:
     raise ValueError(f"cannot convert {repr(value)} to int")
 
 
+_EVENT_LOOPS = threading.local()
+
+
+class _EventLoopHolder:
+    """
+    Holds a thread's event loop. Thread-locals are released when their
+    thread ends, so the loop (and its selector) gets closed with it.
+    """
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        weakref.finalize(self, self.loop.close)
+
+
 def run_until_complete(*item: Any) -> Any:
     """
     Completes the given coroutine and returns its value.
@@ -382,10 +398,24 @@ def run_until_complete(*item: Any) -> Any:
         return items if len(items) > 1 else items[0]
 
     # Run all coroutines async.
-    task = gather(*items, return_exceptions=True) if len(items) > 1 else items[0]
-    loop = asyncio.get_event_loop()
-    result = loop.run_until_complete(task)
-    return result
+    task = _gather(*items) if len(items) > 1 else items[0]
+    return _get_event_loop().run_until_complete(task)
+
+
+async def _gather(*coroutines: Coroutine) -> list:
+    # NOTE: Gather inside a coroutine so the tasks bind to the running loop.
+    return await gather(*coroutines, return_exceptions=True)
+
+
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    # perf: Re-use one event loop per thread rather than looking one up
+    #   (or creating one) on every call. Also works in worker threads.
+    holder = getattr(_EVENT_LOOPS, "holder", None)
+    if holder is None or holder.loop.is_closed():
+        holder = _EventLoopHolder()
+        _EVENT_LOOPS.holder = holder
+
+    return holder.loop
 
 
 def nonreentrant(key_fn):
@@ -418,6 +448,12 @@ def get_current_timestamp_ms() -> int:
     return round(datetime.now(tz=timezone.utc).timestamp() * 1000)
 
 
+# Pre-compile addresses in their short (e.g. ``0x1``) and full forms.
+_EVM_PRECOMPILES = frozenset(
+    (*(f"0x{i}" for i in range(1, 10)), *(f"0x{i:040x}" for i in range(1, 10)))
+)
+
+
 def is_evm_precompile(address: str) -> bool:
     """
     Returns ``True`` if the given address string is a known
@@ -430,8 +466,13 @@ def is_evm_precompile(address: str) -> bool:
         bool
     """
     try:
+        if address in _EVM_PRECOMPILES:
+            return True
+
         address = address.replace("0x", "")
-        return 0 < sum(int(x) for x in address) < 10
+        # perf: Most values (addresses, method IDs) contain hex letters;
+        #   reject those up-front instead of raising on the first letter.
+        return address.isdecimal() and 0 < sum(int(x) for x in address) < 10
     except Exception:
         return False
 
@@ -1,7 +1,10 @@
+import os
+import re
 from collections.abc import Sequence
-from fnmatch import fnmatch
-from statistics import mean, median
-from typing import TYPE_CHECKING
+from fnmatch import translate
+from functools import lru_cache
+from statistics import median
+from typing import TYPE_CHECKING, Optional
 
 from rich.box import SIMPLE
 from rich.table import Table
@@ -70,12 +73,15 @@ def parse_gas_table(report: "GasReport") -> list[Table]:
                 method_call = "__init__"
 
             has_at_least_1_row = True
+            # perf: `statistics.mean()` sums using exact fractions, which is slow
+            #   for methods called many times. Gas values are ints, so this is the same.
+            mean_gas = sum(gases) / len(gases)
             table.add_row(
                 method_call,
                 f"{len(gases)}",
                 f"{min(gases)}",
                 f"{max(gases)}",
-                f"{int(round(mean(gases)))}",
+                f"{int(round(mean_gas))}",
                 f"{int(round(median(gases)))}",
             )
 
@@ -210,24 +216,55 @@ def _parse_verbose_coverage(coverage: "CoverageReport", statement: bool = True)
     return tables
 
 
+@lru_cache(maxsize=64)
+def _get_exclusions_matchers(
+    exclusions: tuple[tuple[str, Optional[str]], ...],
+) -> tuple[Optional[re.Pattern], tuple[tuple[re.Pattern, re.Pattern], ...]]:
+    # NOTE: Same semantics as `fnmatch.fnmatch()` per pattern, but the whole-contract
+    #   exclusions are combined into one regex and the method exclusions into one
+    #   regex per contract pattern. Each translated pattern keeps its own end anchor.
+    contract_patterns: list[str] = []
+    method_patterns: dict[str, list[str]] = {}
+    for contract_name, method_name in exclusions:
+        contract_pattern = translate(os.path.normcase(contract_name))
+        if method_name is None:
+            contract_patterns.append(contract_pattern)
+        elif method_name:
+            method_pattern = translate(os.path.normcase(method_name))
+            method_patterns.setdefault(contract_pattern, []).append(method_pattern)
+
+    contract_matcher = _compile_any(contract_patterns) if contract_patterns else None
+    method_matchers = tuple(
+        (re.compile(contract_pattern), _compile_any(patterns))
+        for contract_pattern, patterns in method_patterns.items()
+    )
+    return contract_matcher, method_matchers
+
+
+def _compile_any(patterns: list[str]) -> re.Pattern:
+    return re.compile("|".join(f"(?:{p})" for p in patterns))
+
+
 def _exclude_gas(
     exclusions: Sequence["ContractFunctionPath"], contract_id: str, method_id: str
 ) -> bool:
-    for exclusion in exclusions:
-        if exclusion.method_name is None and fnmatch(contract_id, exclusion.contract_name):
-            # Skip this whole contract. Search contracts from sub-calls.
-            return True
-
-        for excl in exclusions:
-            if not excl.method_name:
-                # Full contract skips handled above.
-                continue
-
-            elif not fnmatch(contract_id, excl.contract_name):
-                # Method may match, but contract does not match, so continue.
-                continue
+    # perf: Called for every (contract, method) pair in the call tree, so match all
+    #   the exclusions at once rather than each pattern separately.
+    if not exclusions:
+        return False
 
-            elif method_id and fnmatch(method_id, excl.method_name):
+    contract_matcher, method_matchers = _get_exclusions_matchers(
+        tuple((e.contract_name, e.method_name) for e in exclusions)
+    )
+    contract_id = os.path.normcase(contract_id)
+    if contract_matcher is not None and contract_matcher.match(contract_id):
+        # Skip this whole contract. Search contracts from sub-calls.
+        return True
+
+    elif method_matchers and method_id:
+        method_id = os.path.normcase(method_id)
+        for contract_re, method_re in method_matchers:
+            if contract_re.match(contract_id) and method_re.match(method_id):
                 # Skip this report because of the method name exclusion criteria.
                 return True
 
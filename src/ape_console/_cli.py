@@ -1,4 +1,3 @@
-import faulthandler
 import inspect
 import logging
 import sys
@@ -176,9 +175,6 @@ def console(
     import IPython
     from IPython.terminal.ipapp import Config as IPythonConfig
 
-    from ape.utils.misc import _python_version
-    from ape.version import version as ape_version
-
     extra_locals = extra_locals or {}
     if project is None:
         from ape.utils.basemodel import ManagerAccessMixin
@@ -191,6 +187,9 @@ def console(
     project_path: Path = project if isinstance(project, Path) else project.path
     banner = ""
     if verbose:
+        from ape.utils.misc import _python_version
+        from ape.version import version as ape_version
+
         banner = """
    Python:  {python_version}
   IPython:  {ipython_version}
@@ -206,7 +205,11 @@ def console(
         )
 
         if not environ.get("APE_TESTING"):
-            faulthandler.enable()  # NOTE: In case we segfault
+            import faulthandler
+
+            # NOTE: In case we segfault. Already enabled if the console was launched before.
+            if not faulthandler.is_enabled():
+                faulthandler.enable()
 
     # Allows modules relative to the project.
     sys.path.insert(0, f"{project_path}")
@@ -1,14 +1,15 @@
 import re
 from collections.abc import Iterator, Sequence
 from decimal import Decimal
-from functools import cached_property
-from typing import TYPE_CHECKING, Any, ClassVar, Optional, Union, cast
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Optional, Union, cast
 
 import rlp  # type: ignore
 from cchecksum import to_checksum_address
-from eth_abi import decode, encode
+from eth_abi import encode, grammar
 from eth_abi.exceptions import InsufficientDataBytes, NonEmptyPaddingBytes
 from eth_pydantic_types import HexBytes
+from eth_pydantic_types.hex import hex_serializer
 from eth_typing import Hash32, HexStr
 from eth_utils import (
     add_0x_prefix,
@@ -22,7 +23,9 @@ from eth_utils import (
     to_hex,
 )
 from ethpm_types.abi import ABIType, ConstructorABI, EventABI, MethodABI
+from hexbytes import HexBytes as BaseHexBytes
 from pydantic import Field, computed_field, field_validator, model_validator
+from pydantic_core.core_schema import CoreSchema, bytes_schema, no_info_plain_validator_function
 from pydantic_settings import SettingsConfigDict
 
 from ape.api.config import PluginConfig
@@ -45,7 +48,14 @@ from ape.types.events import ContractLog
 from ape.types.gas import AutoGasLimit, GasLimit
 from ape.types.signatures import TransactionSignature
 from ape.types.units import CurrencyValueComparable
-from ape.utils.abi import LogInputABICollection, Struct, StructParser, is_array, returns_array
+from ape.utils.abi import (
+    LogInputABICollection,
+    Struct,
+    StructParser,
+    decode_abi,
+    is_array,
+    returns_array,
+)
 from ape.utils.basemodel import _assert_not_ipython_check, only_raise_attribute_error
 from ape.utils.misc import (
     DEFAULT_LIVE_NETWORK_BASE_FEE_MULTIPLIER,
@@ -64,7 +74,7 @@ from ape_ethereum.proxies import (
     ProxyInfo,
     ProxyType,
 )
-from ape_ethereum.trace import _REVERT_PREFIX, Trace, TransactionTrace
+from ape_ethereum.trace import _REVERT_PREFIX, _REVERT_PREFIX_BYTES, Trace, TransactionTrace
 from ape_ethereum.transactions import (
     AccessListTransaction,
     BaseTransaction,
@@ -92,6 +102,16 @@ NETWORKS = {
 }
 BLUEPRINT_HEADER = HexBytes("0xfe71")
 
+# The UTF-8 encoding of U+FFFD (the character used to replace invalid bytes).
+_UTF8_REPLACEMENT_CHAR = "\ufffd".encode("utf8")
+
+# Array element types with a simple, per-element conversion.
+_INTEGER_TYPE_PATTERN = re.compile(r"u?int\d*")
+_BYTES_TYPE_PATTERN = re.compile(r"bytes\d*")
+
+# Pre-compile (checksummed) addresses mapped to their number.
+_PRECOMPILE_ADDRESSES: dict[str, int] = {f"0x{i:040x}": i for i in range(1, 10)}
+
 
 class NetworkConfig(PluginConfig):
     """
@@ -171,14 +191,17 @@ class NetworkConfig(PluginConfig):
         elif isinstance(value, int):
             return value
 
-        elif isinstance(value, str) and value.isnumeric():
-            return int(value)
+        elif isinstance(value, str):
+            if value.isnumeric():
+                return int(value)
 
-        elif isinstance(value, str) and is_hex(value) and is_0x_prefixed(value):
-            return int(value, 16)
+            # NOTE: Check the prefix first so the hex regex only runs on likely-hex values.
+            elif is_0x_prefixed(value):
+                if is_hex(value):
+                    return int(value, 16)
 
-        elif is_hex(value):
-            raise ValueError("Gas limit hex str must include '0x' prefix.")
+            elif is_hex(value):
+                raise ValueError("Gas limit hex str must include '0x' prefix.")
 
         raise ValueError(f"Invalid gas limit '{value}'")
 
@@ -346,6 +369,29 @@ class EthereumConfig(BaseEthereumConfig):
     sepolia: NetworkConfig = create_network_config(block_time=15)
 
 
+class _BlockHashBytes(HexBytes):
+    """
+    A ``HexBytes`` field type for block hashes that passes through values
+    that are already ``HexBytes`` (such as those from ``web3.py``) without
+    copying or re-validating them, since every block parse validates these.
+    """
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, value, handle=None) -> CoreSchema:
+        return no_info_plain_validator_function(
+            cls._validate_block_hash,
+            serialization=hex_serializer,
+            json_schema_input_schema=bytes_schema(),
+        )
+
+    @classmethod
+    def _validate_block_hash(cls, value: Any) -> BaseHexBytes:
+        if isinstance(value, BaseHexBytes):
+            return value
+
+        return cls.__eth_pydantic_validate__(value)
+
+
 class Block(BlockAPI):
     """
     Class for representing a block on a chain.
@@ -359,8 +405,8 @@ class Block(BlockAPI):
     uncles: list[HexBytes] = []
 
     # Type re-declares.
-    hash: Optional[HexBytes] = None
-    parent_hash: HexBytes = Field(
+    hash: Optional[_BlockHashBytes] = None
+    parent_hash: _BlockHashBytes = Field(  # type: ignore[assignment]
         default=EMPTY_BYTES32, alias="parentHash"
     )  # NOTE: genesis block has no parent hash
 
@@ -393,6 +439,10 @@ class Ethereum(EcosystemAPI):
 
     fee_token_symbol: str = "ETH"
 
+    # perf: Token symbols looked up while enriching traces, so each token
+    #   is only called once per session (see `_get_token_symbol()`).
+    _token_symbols: dict[tuple[str, AddressType, Optional[str]], Optional[str]] = {}
+
     @property
     def config(self) -> EthereumConfig:
         return cast(EthereumConfig, super().config)
@@ -603,9 +653,11 @@ class Ethereum(EcosystemAPI):
         else:
             receipt_cls = Receipt
 
-        error = receipt_kwargs.pop("error", None)
         receipt = receipt_cls.model_validate(receipt_kwargs)
-        receipt.error = error
+        if error := data.get("error"):
+            # NOTE: Set when the error is already known from sending the transaction.
+            receipt.error = error
+
         return receipt
 
     def decode_block(self, data: dict) -> BlockAPI:
@@ -681,32 +733,24 @@ class Ethereum(EcosystemAPI):
         return HexBytes(encoded_calldata)
 
     def decode_calldata(self, abi: Union[ConstructorABI, MethodABI], calldata: bytes) -> dict:
-        raw_input_types = [i.canonical_type for i in abi.inputs]
-        input_types = [parse_type(i.model_dump()) for i in abi.inputs]
+        raw_input_types, input_types, input_names = _get_abi_types(abi)
 
         try:
-            raw_input_values = decode(raw_input_types, calldata, strict=False)
+            raw_input_values = decode_abi(raw_input_types, calldata, strict=False)
         except (InsufficientDataBytes, OverflowError, NonEmptyPaddingBytes) as err:
             raise DecodingError(str(err)) from err
 
         input_values = [
             self.decode_primitive_value(v, t) for v, t in zip(raw_input_values, input_types)
         ]
-        arguments = {}
-        index = 0
-        for i, v in zip(abi.inputs, input_values):
-            name = i.name or f"{index}"
-            arguments[name] = v
-            index += 1
-
-        return arguments
+        return dict(zip(input_names, input_values))
 
     def decode_returndata(self, abi: MethodABI, raw_data: bytes) -> tuple[Any, ...]:
-        output_types_str_ls = [o.canonical_type for o in abi.outputs]
+        output_types_str_ls, output_types, _ = _get_abi_types(abi, outputs=True)
 
         if raw_data:
             try:
-                vm_return_values = decode(output_types_str_ls, raw_data, strict=False)
+                vm_return_values = decode_abi(output_types_str_ls, raw_data, strict=False)
             except (InsufficientDataBytes, NonEmptyPaddingBytes) as err:
                 raise DecodingError(str(err)) from err
         else:
@@ -719,7 +763,6 @@ class Ethereum(EcosystemAPI):
         elif not isinstance(vm_return_values, (tuple, list)):
             vm_return_values = (vm_return_values,)
 
-        output_types = [parse_type(o.model_dump()) for o in abi.outputs]
         output_values = [
             self.decode_primitive_value(v, t) for v, t in zip(vm_return_values, output_types)
         ]
@@ -755,22 +798,29 @@ class Ethereum(EcosystemAPI):
 
     def _enrich_value(self, value: Any, **kwargs) -> Any:
         if isinstance(value, bytes):
-            try:
-                string_value = value.strip(b"\x00").decode("utf8")
+            if (string_value := _decode_utf8(value)) is not None:
                 return f'"{string_value}"'
-            except UnicodeDecodeError:
-                # Truncate bytes if very long.
-                if len(value) > 24:
-                    return f"{add_0x_prefix(HexStr(humanize_hash(cast(Hash32, value))))}"
 
-                hex_str = to_hex(value)
-                if is_hex_address(hex_str):
-                    return self._enrich_value(hex_str, **kwargs)
+            # Truncate bytes if very long.
+            if len(value) > 24:
+                return f"{add_0x_prefix(HexStr(humanize_hash(cast(Hash32, value))))}"
+
+            # perf: Same as `to_hex()` without its type dispatch. Use `bytes.hex()`
+            #   because `HexBytes.hex()` is 0x-prefixed in some supported versions.
+            hex_str = f"0x{bytes.hex(value)}"
+            if len(value) == 20:
+                # Address.
+                return self._enrich_value(hex_str, **kwargs)
 
-                return hex_str
+            return hex_str
+
+        elif isinstance(value, str) and _is_hex_address(value):
+            # perf: Checksumming is not cheap and the same addresses repeat a lot
+            #   within a call tree (see `_enrich_calltree()`).
+            addresses = kwargs.setdefault("_addresses", {})
+            if (address := addresses.get(value)) is None:
+                address = addresses[value] = self.decode_address(value)
 
-        elif isinstance(value, str) and is_hex_address(value):
-            address = self.decode_address(value)
             return self._enrich_contract_id(address, **kwargs)
 
         elif isinstance(value, str):
@@ -781,6 +831,11 @@ class Ethereum(EcosystemAPI):
             return int(value)  # Eliminate int-base classes.
 
         elif isinstance(value, (list, tuple)):
+            # perf: Large arrays (e.g. from multicalls) are usually all integers;
+            #   skip dispatching each item. Same result as the `int` branch above.
+            if all(isinstance(v, int) for v in value):
+                return [int(v) for v in value]
+
             return [self._enrich_value(v, **kwargs) for v in value]
 
         elif isinstance(value, Struct):
@@ -811,6 +866,11 @@ class Ethereum(EcosystemAPI):
             if not isinstance(value, (list, tuple)):
                 value = (value,)
 
+            # perf: Convert arrays of simple types (e.g. large uint256[] returns)
+            #   without dispatching on every element.
+            if convert := _get_array_element_converter(sub_type):
+                return [convert(v) for v in value]
+
             return [self.decode_primitive_value(v, sub_type) for v in value]
 
         elif isinstance(output_type, tuple):
@@ -1074,14 +1134,10 @@ class Ethereum(EcosystemAPI):
             # Already enriched.
             return call
 
-        if self._test_runner and self._test_runner.gas_tracker.enabled:
-            default_symbol_for_tokens = not self._test_runner.gas_tracker.enabled
-        else:
-            default_symbol_for_tokens = True
-
-        kwargs["use_symbol_for_tokens"] = kwargs.get(
-            "use_symbol_for_tokens", default_symbol_for_tokens
-        )
+        # perf: Only resolve the default at the root; sub-calls inherit it through kwargs.
+        if "use_symbol_for_tokens" not in kwargs:
+            test_runner = self._test_runner
+            kwargs["use_symbol_for_tokens"] = not (test_runner and test_runner.gas_tracker.enabled)
 
         # Handle if for some reason this is still an Enum.
         call_type = call.get("call_type", "")
@@ -1090,6 +1146,13 @@ class Ethereum(EcosystemAPI):
 
         is_create = "CREATE" in call_type
 
+        # perf: Traces tend to call the same contracts many times (routers, tokens, etc.),
+        #   so share per-address lookups (contract types, checksums, token symbols) across the tree.
+        kwargs.setdefault("_contract_types", {})
+        kwargs.setdefault("_addresses", {})
+        contract_ids = kwargs.setdefault("_contract_ids", {})
+        method_abis = kwargs.setdefault("_method_abis", {})
+
         # Enrich sub-calls first.
         if subcalls := call.get("calls"):
             call["calls"] = [self._enrich_calltree(c, **kwargs) for c in subcalls]
@@ -1105,33 +1168,36 @@ class Ethereum(EcosystemAPI):
             call["contract_id"] = address
 
         if calldata := call.get("calldata"):
-            calldata_bytes = HexBytes(calldata)
+            # perf: Use plain bytes so slicing does not create more `HexBytes` objects.
+            calldata_bytes = bytes(HexBytes(calldata))
             call["method_id"] = to_hex(calldata_bytes[:4])
             call["calldata"] = calldata if is_create else to_hex(calldata_bytes[4:])
 
         else:
             call["method_id"] = "0x"
 
-        try:
-            address_int = int(address, 16)
-        except Exception:
-            pass
-        else:
-            # Collapse pre-compile address calls
-            if 1 <= address_int <= 9:
-                return (
-                    call["calls"][0]
-                    if len(call.get("calls", [])) == 1
-                    else {"contract_id": f"{address_int}", "calls": call["calls"]}
-                )
+        # Collapse pre-compile address calls
+        if precompile := _get_precompile_number(address):
+            return (
+                call["calls"][0]
+                if len(call.get("calls", [])) == 1
+                else {"contract_id": f"{precompile}", "calls": call["calls"]}
+            )
+
+        contract_type = self._get_contract_type_for_enrichment(address, **kwargs)
 
         depth = call.get("depth", 0)
         if depth == 0 and address in self.account_manager:
             call["contract_id"] = f"__{self.fee_token_symbol}_transfer__"
+        elif (contract_id := contract_ids.get(address)) is not None:
+            call["contract_id"] = contract_id
         else:
-            call["contract_id"] = self._enrich_contract_id(call["contract_id"], **kwargs)
+            id_kwargs = {**kwargs, "contract_type": contract_type} if contract_type else kwargs
+            call["contract_id"] = contract_ids[address] = self._enrich_contract_id(
+                call["contract_id"], **id_kwargs
+            )
 
-        if not (contract_type := self._get_contract_type_for_enrichment(address, **kwargs)):
+        if not contract_type:
             # Without a contract type, we can enrich no further.
             return call
 
@@ -1145,23 +1211,16 @@ class Ethereum(EcosystemAPI):
             name = "__new__"
 
         elif call["method_id"] != "0x":
-            method_id_bytes = HexBytes(call["method_id"])
-
-            # perf: use try/except instead of __contains__ check.
-            try:
-                method_abi = contract_type.methods[method_id_bytes]
-            except KeyError:
-                name = call["method_id"]
+            if (contract_method_abis := method_abis.get(address)) is None:
+                contract_method_abis = method_abis[address] = _get_method_abis(contract_type)
+
+            if method_abi := contract_method_abis.get(call["method_id"]):
+                # Check if method name duplicated. If that is the case, use selector.
+                times = len([x for x in contract_type.methods if x.name == method_abi.name])
+                name = (method_abi.name if times == 1 else method_abi.selector) or call["method_id"]
+                call = self._enrich_calldata(call, method_abi, **kwargs)
             else:
-                if isinstance(method_abi, MethodABI):
-                    # Check if method name duplicated. If that is the case, use selector.
-                    times = len([x for x in contract_type.methods if x.name == method_abi.name])
-                    name = (method_abi.name if times == 1 else method_abi.selector) or call[
-                        "method_id"
-                    ]
-                    call = self._enrich_calldata(call, method_abi, **kwargs)
-                else:
-                    name = call.get("method_id") or "0x"
+                name = call["method_id"]
         else:
             name = call.get("method_id") or "0x"
 
@@ -1199,27 +1258,49 @@ class Ethereum(EcosystemAPI):
         kwargs["contract_type"] = contract_type
         if kwargs.get("use_symbol_for_tokens") and "symbol" in contract_type.view_methods:
             # Use token symbol as name
-            contract = self.chain_manager.contracts.instance_at(
-                address, contract_type=contract_type
-            )
+            if (symbol := self._get_token_symbol(address, contract_type)) is not None:
+                return symbol
 
-            try:
-                symbol = contract.symbol(skip_trace=True)
-            except ApeException:
-                symbol = None
+        name = contract_type.name.strip() if contract_type.name else None
+        return name or address
 
-            if isinstance(symbol, str):
-                return symbol.strip()
+    def _get_token_symbol(
+        self, address: AddressType, contract_type: "ContractType"
+    ) -> Optional[str]:
+        network = self.provider.network
+        if network.is_dev:
+            # NOTE: Dev chains get reset and re-deployed to the same addresses,
+            #   so a session-wide cache could show the wrong symbol there.
+            return self._call_token_symbol(address, contract_type)
 
-            # bytes32 symbol appears in ds-token
-            if isinstance(symbol, bytes):
-                try:
-                    return symbol.rstrip(b"\x00").decode()
-                except UnicodeDecodeError:
-                    return str(symbol)
+        # NOTE: Failed calls are cached too, so they are not retried for every trace.
+        key = (network.name, address, contract_type.name)
+        if key not in self._token_symbols:
+            self._token_symbols[key] = self._call_token_symbol(address, contract_type)
 
-        name = contract_type.name.strip() if contract_type.name else None
-        return name or address
+        return self._token_symbols[key]
+
+    def _call_token_symbol(
+        self, address: AddressType, contract_type: "ContractType"
+    ) -> Optional[str]:
+        contract = self.chain_manager.contracts.instance_at(address, contract_type=contract_type)
+
+        try:
+            symbol = contract.symbol(skip_trace=True)
+        except ApeException:
+            return None
+
+        if isinstance(symbol, str):
+            return symbol.strip()
+
+        # bytes32 symbol appears in ds-token
+        if isinstance(symbol, bytes):
+            try:
+                return symbol.rstrip(b"\x00").decode()
+            except UnicodeDecodeError:
+                return str(symbol)
+
+        return None
 
     def _enrich_calldata(
         self,
@@ -1399,10 +1480,18 @@ class Ethereum(EcosystemAPI):
 
     def _enrich_revert_message(self, call: dict) -> dict:
         returndata = call.get("returndata", "")
-        is_hexstr = isinstance(returndata, str) and is_0x_prefixed(returndata)
-        if is_hexstr and returndata.startswith(_REVERT_PREFIX):
+        revert_data: Optional[bytes] = None
+        if isinstance(returndata, bytes):
+            # perf: Compare the raw bytes rather than hex-encoding them first.
+            if returndata.startswith(_REVERT_PREFIX_BYTES):
+                revert_data = returndata[4:]
+
+        elif isinstance(returndata, str) and returndata.startswith(_REVERT_PREFIX):
+            revert_data = HexBytes(returndata)[4:]
+
+        if revert_data is not None:
             # The returndata is the revert-str.
-            decoded_result = decode(("string",), HexBytes(returndata)[4:])
+            decoded_result = decode_abi(("string",), revert_data)
             call["revert_message"] = decoded_result[0] if len(decoded_result) == 1 else ""
 
         return call
@@ -1410,11 +1499,21 @@ class Ethereum(EcosystemAPI):
     def _get_contract_type_for_enrichment(
         self, address: AddressType, **kwargs
     ) -> Optional["ContractType"]:
-        if not (contract_type := kwargs.get("contract_type")):
-            try:
-                contract_type = self.chain_manager.contracts.get(address)
-            except Exception as err:
-                logger.debug(f"Error getting contract type during event enrichment: {err}")
+        if contract_type := kwargs.get("contract_type"):
+            return contract_type
+
+        # NOTE: Set when enriching a call tree.
+        contract_types = kwargs.get("_contract_types")
+        if contract_types is not None and address in contract_types:
+            return contract_types[address]
+
+        try:
+            contract_type = self.chain_manager.contracts.get(address)
+        except Exception as err:
+            logger.debug(f"Error getting contract type during event enrichment: {err}")
+
+        if contract_types is not None:
+            contract_types[address] = contract_type
 
         return contract_type
 
@@ -1502,6 +1601,95 @@ def parse_type(type_: dict[str, Any]) -> Union[str, tuple, list]:
     return [result] if is_array(type_["type"]) else result
 
 
+def _get_abi_types(
+    abi: Union[ConstructorABI, MethodABI], outputs: bool = False
+) -> tuple[tuple[str, ...], tuple, tuple[str, ...]]:
+    items = abi.outputs if isinstance(abi, MethodABI) and outputs else abi.inputs
+    canonical_types = tuple(i.canonical_type for i in items)
+    names = tuple(i.name or f"{idx}" for idx, i in enumerate(items))
+    return canonical_types, _get_parsed_types(canonical_types), names
+
+
+@lru_cache(maxsize=1024)
+def _get_parsed_types(canonical_types: tuple[str, ...]) -> tuple:
+    # perf: The same ABIs are decoded repeatedly (e.g. per call in a trace),
+    #   so only parse the types of each distinct signature once.
+    return tuple(_parse_canonical_type(grammar.parse(t)) for t in canonical_types)
+
+
+def _parse_canonical_type(abi_type: grammar.ABIType) -> Union[str, tuple, list]:
+    # NOTE: Same result as `parse_type()`, but from the parsed canonical type.
+    if not isinstance(abi_type, grammar.TupleType):
+        return abi_type.to_type_str()
+
+    result = tuple(_parse_canonical_type(c) for c in abi_type.components)
+    return [result] if abi_type.is_array else result
+
+
+def _is_hex_address(value: str) -> bool:
+    # perf: Most strings are obviously not addresses, so check the length (40 hex
+    #   characters, optionally 0x-prefixed) before the full `is_hex_address()` check.
+    return len(value) in (40, 42) and is_hex_address(value)
+
+
+def _decode_utf8(value: bytes) -> Optional[str]:
+    # perf: Most non-text values (hashes, etc.) are not valid UTF-8. Decoding with
+    #   replacements and checking for them is cheaper than raising (and catching)
+    #   a UnicodeDecodeError for each of those values.
+    text = value.strip(b"\x00").decode("utf8", errors="replace")
+    if "\ufffd" not in text:
+        return text
+
+    elif _UTF8_REPLACEMENT_CHAR not in value:
+        # All the replacements came from invalid bytes.
+        return None
+
+    try:
+        return value.strip(b"\x00").decode("utf8")
+    except UnicodeDecodeError:
+        return None
+
+
+@lru_cache(maxsize=256)
+def _get_array_element_converter(element_type: str) -> Optional[Callable[[Any], Any]]:
+    # The conversion decode_primitive_value() would apply to every element,
+    # for the element types that need no per-element checks.
+    if _INTEGER_TYPE_PATTERN.fullmatch(element_type):
+        return CurrencyValueComparable
+
+    elif _BYTES_TYPE_PATTERN.fullmatch(element_type):
+        return HexBytes
+
+    return None
+
+
+def _get_precompile_number(address: Any) -> Optional[int]:
+    # perf: Most addresses are already checksummed, so use a lookup instead of parsing.
+    if (number := _PRECOMPILE_ADDRESSES.get(address)) is not None:
+        return number
+
+    elif isinstance(address, str) and len(address) == 42:
+        # A regular address that is not a pre-compile.
+        return None
+
+    try:
+        number = int(address, 16)
+    except Exception:
+        return None
+
+    return number if 1 <= number <= 9 else None
+
+
+def _get_method_abis(contract_type: "ContractType") -> dict[str, MethodABI]:
+    # perf: `contract_type.methods[selector]` hashes every method signature on
+    #   each lookup, and `identifier_lookup` is rebuilt on every access. Map the
+    #   cached method IDs to their ABIs once per contract instead.
+    method_ids = contract_type.method_identifiers
+    return {
+        method_ids[abi.selector]: abi for abi in contract_type.methods if abi.selector in method_ids
+    }
+
+
 def _correct_key(key: str, data: dict, alt_keys: tuple[str, ...]) -> dict:
     if key in data:
         return data
@@ -4,23 +4,25 @@ import re
 import sys
 import time
 from abc import ABC
+from collections import deque
 from collections.abc import Iterable, Iterator
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
 from copy import copy
+from dataclasses import dataclass
 from functools import cached_property, wraps
+from itertools import chain, islice
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, Callable, NoReturn, Optional, Union, cast
 
 import ijson  # type: ignore
-import requests
 from eth_pydantic_types import HexBytes
 from eth_typing import BlockNumber, HexStr
-from eth_utils import add_0x_prefix, is_hex, to_hex
+from eth_utils import add_0x_prefix, is_0x_prefixed, is_hex, to_hex
 from evmchains import PUBLIC_CHAIN_META, get_random_rpc
-from pydantic.dataclasses import dataclass
-from requests import HTTPError
+from requests import HTTPError, Session
 from web3 import HTTPProvider, IPCProvider, Web3
 from web3 import __version__ as web3_version
+from web3._utils.encoding import Web3JsonEncoder
 from web3.exceptions import ContractLogicError as Web3ContractLogicError
 from web3.exceptions import (
     ExtraDataLengthError,
@@ -69,7 +71,13 @@ from ape.utils.misc import DEFAULT_MAX_RETRIES_TX, gas_estimation_error_message,
 from ape.utils.rpc import request_with_retry
 from ape_ethereum._print import CONSOLE_ADDRESS, console_contract
 from ape_ethereum.trace import CallTrace, TraceApproach, TransactionTrace
-from ape_ethereum.transactions import AccessList, AccessListTransaction, TransactionStatusEnum
+from ape_ethereum.transactions import (
+    AccessList,
+    AccessListTransaction,
+    StaticFeeTransaction,
+    TransactionStatusEnum,
+    TransactionType,
+)
 
 if TYPE_CHECKING:
     from ethpm_types import EventABI
@@ -84,6 +92,42 @@ DEFAULT_HOSTNAME = "localhost"
 DEFAULT_HTTP_URI = f"http://{DEFAULT_HOSTNAME}:{DEFAULT_PORT}"
 DEFAULT_SETTINGS = {"uri": DEFAULT_HTTP_URI}
 
+# perf: Compare raw type values to avoid constructing ``TransactionType`` per transaction.
+_STATIC_FEE_TXN_TYPES = (TransactionType.STATIC.value, TransactionType.ACCESS_LIST.value)
+_DYNAMIC_FEE_TXN_TYPES = (TransactionType.DYNAMIC.value, TransactionType.SHARED_BLOB.value)
+
+# Transaction keys that are not used in calls.
+_CALL_EXCLUDED_KEYS = ("gas", "gasLimit", "maxFeePerGas", "maxPriorityFeePerGas", "signature")
+
+# The static part of raw eth_call request bodies; only the params are serialized per call.
+_ETH_CALL_REQUEST_PREFIX = b'{"jsonrpc":"2.0","id":0,"method":"eth_call","params":'
+
+# The default timeout for HTTP RPC requests, used by web3 and raw requests alike.
+_DEFAULT_HTTP_TIMEOUT = 30 * 60
+
+# The max number of entries in each RPC-response cache.
+_MAX_RPC_CACHE_SIZE = 4096
+
+# Seconds to re-use live-network gas values before fetching again.
+_GAS_PRICE_CACHE_TTL = 10.0
+_MAX_GAS_CACHE_TTL = 12.0
+_LATEST_BLOCK_CACHE_TTL = 1.0
+
+# Block times (in seconds) at or below this are polled more frequently for receipts.
+_FAST_BLOCK_TIME = 2
+
+
+@dataclass(frozen=True)
+class _YieldAction:
+    # The last block yielded when polling blocks.
+    # perf: A slotted, module-level dataclass rather than a pydantic one
+    #   defined (and validated) on every poll.
+    __slots__ = ("hash", "number", "time")
+
+    hash: bytes
+    number: int
+    time: float
+
 
 def _sanitize_web3_url(msg: str) -> str:
     """Sanitize RPC URI from given log string"""
@@ -166,8 +210,49 @@ class Web3Provider(ProviderAPI, ABC):
 
     _supports_debug_trace_call: Optional[bool] = None
 
+    _supports_tracing: Optional[bool] = None
+    """
+    Is ``None`` until probed. Cleared on disconnect.
+    """
+
+    _supports_batch_requests: Optional[bool] = None
+    """
+    Is ``None`` until a JSON-RPC batch request is attempted.
+    """
+
     _transaction_trace_cache: dict[str, TransactionTrace] = {}
 
+    _block_cache: dict[bytes, BlockAPI] = {}
+    """
+    Blocks by hash. Only hash-identified data is cached, as it cannot change.
+    """
+
+    _code_cache: dict[tuple["AddressType", bytes], "ContractCode"] = {}
+    """
+    Contract code by address and block hash.
+    """
+
+    _gas_cache: dict[str, tuple[float, int]] = {}
+    """
+    Recent gas values (e.g. gas price) on live networks, with the time they were fetched.
+    """
+
+    _log_pool: Optional[ThreadPoolExecutor] = None
+    """
+    Worker threads for fetching pages of logs. Created when first needed.
+    """
+
+    _log_pool_size: int = 0
+    """
+    The number of worker threads in ``_log_pool``.
+    """
+
+    _latest_block_cache: Optional[tuple[float, dict, Optional[BlockAPI]]] = None
+    """
+    The latest block on live networks (raw and, once needed, decoded),
+    with the time it was fetched.
+    """
+
     def __new__(cls, *args, **kwargs):
         assert_web3_provider_uri_env_var_not_set()
 
@@ -499,10 +584,30 @@ class Web3Provider(ProviderAPI, ABC):
 
     @property
     def max_gas(self) -> int:
+        return self._get_cached_gas_value("max_gas", _MAX_GAS_CACHE_TTL, self._get_max_gas)
+
+    def _get_max_gas(self) -> int:
         return int(self._get_latest_block_rpc()["gasLimit"], 16)
 
-    @cached_property
+    @property
     def supports_tracing(self) -> bool:
+        if (supported := self._supports_tracing) is None:
+            supported = self._get_supports_tracing()
+            self._supports_tracing = supported
+
+        return supported
+
+    def _get_supports_tracing(self) -> bool:
+        # perf: Most nodes list their enabled namespaces, which is a cheaper check
+        #   than probing a trace RPC. Only probe nodes that do not expose them.
+        try:
+            modules = self.make_request("rpc_modules")
+        except Exception:
+            modules = None
+
+        if isinstance(modules, dict) and modules:
+            return "debug" in modules or "trace" in modules
+
         try:
             # NOTE: Txn hash is purposely not a real hash.
             self.make_request("debug_traceTransaction", ["__CHECK_IF_SUPPORTS_TRACING__"])
@@ -515,11 +620,26 @@ class Web3Provider(ProviderAPI, ABC):
 
         return True
 
+    def disconnect(self):
+        self._web3 = None
+        self._clear_rpc_caches()
+
     def update_settings(self, new_settings: dict):
         self.disconnect()
+        # NOTE: In case a subclass's `disconnect()` does not call this one.
+        self._clear_rpc_caches()
         self.provider_settings.update(new_settings)
         self.connect()
 
+    def _clear_rpc_caches(self):
+        # Cached values are only valid for the connection they came from.
+        self._gas_cache = {}
+        self._latest_block_cache = None
+        if pool := self._log_pool:
+            pool.shutdown(wait=False, cancel_futures=True)
+            self._log_pool = None
+            self._log_pool_size = 0
+
     def estimate_gas_cost(self, txn: TransactionAPI, block_id: Optional["BlockID"] = None) -> int:
         # NOTE: Using JSON mode since used as request data.
         txn_dict = txn.model_dump(by_alias=True, mode="json")
@@ -541,15 +661,8 @@ class Web3Provider(ProviderAPI, ABC):
         try:
             return self.web3.eth.estimate_gas(txn_params, block_identifier=block_id)
         except (ValueError, Web3ContractLogicError) as err:
-            # NOTE: Try to use debug_traceCall to obtain a trace.
-            #  And the RPC can be very picky with inputs.
-            tx_to_trace: dict = {}
-            for key, val in txn_params.items():
-                if isinstance(val, int):
-                    tx_to_trace[key] = hex(val)
-                else:
-                    tx_to_trace[key] = val
-
+            # NOTE: The trace is lazy (from the transaction), so there is
+            #   no need to build the call params for it here.
             tx_error = self.get_virtual_machine_error(
                 err,
                 txn=txn,
@@ -603,11 +716,19 @@ class Web3Provider(ProviderAPI, ABC):
 
     @property
     def gas_price(self) -> int:
+        return self._get_cached_gas_value("gas_price", _GAS_PRICE_CACHE_TTL, self._get_gas_price)
+
+    def _get_gas_price(self) -> int:
         price = self.web3.eth.generate_gas_price() or 0
         return to_int(price)
 
     @property
     def priority_fee(self) -> int:
+        return self._get_cached_gas_value(
+            "priority_fee", _GAS_PRICE_CACHE_TTL, self._get_priority_fee
+        )
+
+    def _get_priority_fee(self) -> int:
         try:
             return self.web3.eth.max_priority_fee
         except MethodUnavailable as err:
@@ -616,28 +737,78 @@ class Web3Provider(ProviderAPI, ABC):
                 "eth_maxPriorityFeePerGas not supported in this RPC. Please specify manually."
             ) from err
 
+    def _get_cached_gas_value(self, key: str, ttl: float, getter: Callable[[], int]) -> int:
+        if self.network.is_dev:
+            # NOTE: Local chains are frequently manipulated (mining, snapshots),
+            #   so always get the current value.
+            return getter()
+
+        # perf: Live-network gas values are reasonably fresh for a few seconds,
+        #   so avoid an RPC round trip for every transaction built.
+        now = time.monotonic()
+        if (cached := self._gas_cache.get(key)) is not None and now - cached[0] < ttl:
+            return cached[1]
+
+        value = getter()
+        self._gas_cache[key] = (now, value)
+        return value
+
     def _get_chain_id(self) -> int:
         result = self.make_request("eth_chainId", [])
         return result if isinstance(result, int) else int(result, 16)
 
     def get_block(self, block_id: "BlockID") -> BlockAPI:
-        if isinstance(block_id, str) and block_id.isnumeric():
+        if isinstance(block_id, str) and block_id.isdecimal():
             block_id = int(block_id)
 
+        block_hash = _get_block_hash_key(block_id)
+        if block_hash is not None and (block := self._block_cache.get(block_hash)):
+            return block
+
         try:
             block_data = dict(self.web3.eth.get_block(block_id))
         except Exception as err:
             raise BlockNotFoundError(block_id, reason=str(err)) from err
 
-        return self.network.ecosystem.decode_block(block_data)
+        block = self.network.ecosystem.decode_block(block_data)
+        if block_hash is not None:
+            _set_bounded(self._block_cache, block_hash, block)
+
+        return block
 
     def _get_latest_block(self) -> BlockAPI:
         # perf: By-pass as much as possible since this is a common action.
+        if (cached := self._get_cached_latest_block()) is not None and cached[2] is not None:
+            return cached[2]
+
         data = self._get_latest_block_rpc()
-        return self.network.ecosystem.decode_block(data)
+        block = self.network.ecosystem.decode_block(data)
+        if (cached := self._latest_block_cache) is not None:
+            # Also cache the decoded block, so it is not decoded again.
+            self._latest_block_cache = (cached[0], cached[1], block)
+
+        return block
 
     def _get_latest_block_rpc(self) -> dict:
-        return self.make_request("eth_getBlockByNumber", ["latest", False])
+        if self.network.is_dev:
+            # NOTE: Local chains are frequently manipulated (mining, snapshots),
+            #   so always get the current block.
+            return self.make_request("eth_getBlockByNumber", ["latest", False])
+
+        elif (cached := self._get_cached_latest_block()) is not None:
+            # NOTE: Copy because callers (e.g. `decode_block()`) may modify it.
+            return dict(cached[1])
+
+        data = self.make_request("eth_getBlockByNumber", ["latest", False])
+        self._latest_block_cache = (time.monotonic(), dict(data), None)
+        return data
+
+    def _get_cached_latest_block(self) -> Optional[tuple[float, dict, Optional[BlockAPI]]]:
+        cached = self._latest_block_cache
+        if cached is None or time.monotonic() - cached[0] >= _LATEST_BLOCK_CACHE_TTL:
+            return None
+
+        return cached
 
     def get_nonce(self, address: "AddressType", block_id: Optional["BlockID"] = None) -> int:
         return self.web3.eth.get_transaction_count(address, block_identifier=block_id)
@@ -648,7 +819,18 @@ class Web3Provider(ProviderAPI, ABC):
     def get_code(
         self, address: "AddressType", block_id: Optional["BlockID"] = None
     ) -> "ContractCode":
-        return self.web3.eth.get_code(address, block_identifier=block_id)
+        block_hash = _get_block_hash_key(block_id)
+        if block_hash is None:
+            # NOTE: Code at "latest" (or a block number) may change, e.g. after reverts.
+            return self.web3.eth.get_code(address, block_identifier=block_id)
+
+        key = (address, block_hash)
+        if (code := self._code_cache.get(key)) is not None:
+            return code
+
+        code = self.web3.eth.get_code(address, block_identifier=block_id)
+        _set_bounded(self._code_cache, key, code)
+        return code
 
     def get_storage(
         self, address: "AddressType", slot: int, block_id: Optional["BlockID"] = None
@@ -672,6 +854,53 @@ class Web3Provider(ProviderAPI, ABC):
         self._transaction_trace_cache[transaction_hash] = trace
         return trace
 
+    def get_transaction_traces_by_block(self, block_id: "BlockID") -> Iterator["TraceAPI"]:
+        """
+        Get the traces of all the transactions in a block. When the node supports
+        parity-style tracing, the whole block is traced in a single ``trace_block``
+        request rather than one request per transaction. The traces are cached,
+        so later calls to :meth:`~ape_ethereum.provider.Web3Provider.get_transaction_trace`
+        (e.g. from ``receipt.show_trace()``) for the same transactions are free.
+        **NOTE**: Receipts do not call this on their own (tracing a whole block for
+        one transaction costs more); call it first when tracing many receipts of a block.
+
+        Args:
+            block_id (:class:`~ape.types.BlockID`): The ID of the block.
+
+        Returns:
+            Iterator[:class:`~ape.api.trace.TraceAPI`]
+        """
+        frames_by_txn: Optional[dict[str, list[dict]]] = None
+        if self.call_trace_approach in (None, TraceApproach.PARITY):
+            try:
+                frames = self.make_request("trace_block", [_get_block_param(block_id)])
+            except (ProviderError, NotImplementedError, ValueError) as err:
+                logger.debug(f"Unable to trace block {block_id!r}: {err}")
+            else:
+                frames_by_txn = {}
+                for frame in frames or []:
+                    # NOTE: Block-reward frames have no transaction.
+                    if txn_hash := frame.get("transactionHash"):
+                        frames_by_txn.setdefault(txn_hash, []).append(frame)
+
+        if frames_by_txn is None:
+            # Tracing the block at once is not supported; trace each transaction instead.
+            for txn in self.get_transactions_by_block(block_id):
+                if txn.txn_hash is not None:
+                    yield self.get_transaction_trace(to_hex(txn.txn_hash))
+
+            return
+
+        for txn_hash, txn_frames in frames_by_txn.items():
+            if not (trace := self._transaction_trace_cache.get(txn_hash)):
+                trace = TransactionTrace(
+                    transaction_hash=txn_hash, call_trace_approach=TraceApproach.PARITY
+                )
+                trace._parity_frames = txn_frames
+                self._transaction_trace_cache[txn_hash] = trace
+
+            yield trace
+
     def send_call(
         self,
         txn: TransactionAPI,
@@ -746,20 +975,52 @@ class Web3Provider(ProviderAPI, ABC):
 
         return HexBytes(trace.return_value)
 
+    def send_calls(
+        self,
+        txns: Iterable[TransactionAPI],
+        block_id: Optional["BlockID"] = None,
+        state: Optional[dict] = None,
+    ) -> list[HexBytes]:
+        txns = list(txns)
+        test_runner = self._test_runner
+        if (
+            not self.http_uri
+            or len(txns) < 2
+            # NOTE: Tracked calls need their traces, which `send_call()` handles.
+            or (
+                test_runner is not None
+                and (test_runner.gas_tracker.enabled or test_runner.coverage_tracker.enabled)
+            )
+        ):
+            return super().send_calls(txns, block_id=block_id, state=state)
+
+        kwargs: dict = {"block_identifier": block_id}
+        if state is not None:
+            kwargs["state_override"] = state
+
+        calls = [
+            ("eth_call", _prepare_eth_call_arguments(self._prepare_call(txn, **kwargs)))
+            for txn in txns
+        ]
+        try:
+            results = self.send_batch(calls)
+        except ProviderError:
+            # A call failed (e.g. reverted). Make the calls individually to
+            # get the proper error handling.
+            return super().send_calls(txns, block_id=block_id, state=state)
+
+        if len(results) != len(calls):
+            # Batching not supported.
+            return super().send_calls(txns, block_id=block_id, state=state)
+
+        return [HexBytes(r) for r in results]
+
     def _eth_call(
         self, arguments: list, raise_on_revert: bool = True, skip_trace: bool = False
     ) -> HexBytes:
-        # Force the usage of hex-type to support a wider-range of nodes.
-        txn_dict = copy(arguments[0])
-        if isinstance(txn_dict.get("type"), int):
-            txn_dict["type"] = to_hex(txn_dict["type"])
-
-        # Remove unnecessary values to support a wider-range of nodes.
-        txn_dict.pop("chainId", None)
-
-        arguments[0] = txn_dict
+        arguments = _prepare_eth_call_arguments(arguments)
         try:
-            result = self.make_request("eth_call", arguments)
+            result = self._make_eth_call_request(arguments)
         except Exception as err:
             contract_address = arguments[0].get("to")
             _lazy_call_trace = _LazyCallTrace(arguments)
@@ -793,23 +1054,51 @@ class Web3Provider(ProviderAPI, ABC):
 
         return HexBytes(result)
 
+    def _make_eth_call_request(self, arguments: list) -> Any:
+        if not (uri := self.http_uri) or not self._is_http_connection:
+            return self.make_request("eth_call", arguments)
+
+        # perf: eth_call is the hottest request when simulating, so skip web3's
+        #   provider layer and post a body built from the pre-serialized envelope.
+        params = json.dumps(arguments, cls=Web3JsonEncoder, separators=(",", ":"))
+        body = b"".join((_ETH_CALL_REQUEST_PREFIX, params.encode(), b"}"))
+
+        def post_call():
+            response = self.http_session.post(
+                uri,
+                data=body,
+                headers={"Content-Type": "application/json"},
+                timeout=_DEFAULT_HTTP_TIMEOUT,
+            )
+            try:
+                response.raise_for_status()
+            except HTTPError as err:
+                _raise_http_error("eth_call", err)
+
+            return self._get_rpc_result("eth_call", response.json())
+
+        return request_with_retry(post_call)
+
+    @property
+    def _is_http_connection(self) -> bool:
+        provider = self.web3.provider
+        # NOTE: The auto-provider's active provider is ``None`` until the first request.
+        active = provider._active_provider if isinstance(provider, AutoProvider) else provider
+        return isinstance(active, HTTPProvider)
+
     def _prepare_call(self, txn: Union[dict, TransactionAPI], **kwargs) -> list:
         # NOTE: Using mode="json" because used in request data.
         txn_dict = (
             txn.model_dump(by_alias=True, mode="json") if isinstance(txn, TransactionAPI) else txn
         )
-        fields_to_convert = ("data", "chainId", "value")
-        for field in fields_to_convert:
+        for field in ("data", "chainId", "value"):
             value = txn_dict.get(field)
             if value is not None and not isinstance(value, str):
                 txn_dict[field] = to_hex(value)
 
         # Remove unneeded properties
-        txn_dict.pop("gas", None)
-        txn_dict.pop("gasLimit", None)
-        txn_dict.pop("maxFeePerGas", None)
-        txn_dict.pop("maxPriorityFeePerGas", None)
-        txn_dict.pop("signature", None)
+        for key in _CALL_EXCLUDED_KEYS:
+            txn_dict.pop(key, None)
 
         # NOTE: Block ID is required so if given None, default to `"latest"`.
         block_identifier = kwargs.pop("block_identifier", kwargs.pop("block_id", None)) or "latest"
@@ -822,6 +1111,16 @@ class Web3Provider(ProviderAPI, ABC):
 
         return arguments
 
+    @property
+    def _receipt_poll_latency(self) -> float:
+        # perf: Poll faster on chains where receipts are available quickly,
+        #   else use web3.py's default.
+        block_time = self.network.block_time
+        if self.network.is_dev or 0 < block_time <= _FAST_BLOCK_TIME:
+            return 0.02
+
+        return 0.1
+
     def get_receipt(
         self,
         txn_hash: str,
@@ -850,7 +1149,9 @@ class Web3Provider(ProviderAPI, ABC):
 
         try:
             receipt_data = dict(
-                self.web3.eth.wait_for_transaction_receipt(hex_hash, timeout=timeout)
+                self.web3.eth.wait_for_transaction_receipt(
+                    hex_hash, timeout=timeout, poll_latency=self._receipt_poll_latency
+                )
             )
         except TimeExhausted as err:
             # Since private transactions can take longer,
@@ -910,12 +1211,14 @@ class Web3Provider(ProviderAPI, ABC):
         if isinstance(block_id, str):
             block_id = HexStr(block_id)
 
-            if block_id.isnumeric():
+            if block_id.isdecimal():
                 block_id = add_0x_prefix(block_id)
 
         block = cast(dict, self.web3.eth.get_block(block_id, full_transactions=True))
+        # perf: Look up the ecosystem method once rather than per transaction.
+        create_transaction = self.network.ecosystem.create_transaction
         for transaction in block.get("transactions", []):
-            yield self.network.ecosystem.create_transaction(**transaction)
+            yield create_transaction(**transaction)
 
     def get_transactions_by_account_nonce(
         self,
@@ -1009,17 +1312,11 @@ class Web3Provider(ProviderAPI, ABC):
         if required_confirmations is None:
             required_confirmations = self.network.required_confirmations
 
-        @dataclass
-        class YieldAction:
-            hash: bytes
-            number: int
-            time: float
-
         # Pretend we _did_ yield the last confirmed item, for logic's sake.
         fake_last_block = self.get_block(self.web3.eth.block_number - required_confirmations)
         last_num = fake_last_block.number or 0
         last_hash = fake_last_block.hash or HexBytes(0)
-        last: YieldAction = YieldAction(number=last_num, hash=last_hash, time=time.time())
+        last = _YieldAction(number=last_num, hash=last_hash, time=time.time())
 
         # A helper method for various points of ensuring we didn't timeout.
         def assert_chain_activity():
@@ -1085,7 +1382,7 @@ class Web3Provider(ProviderAPI, ABC):
                     return
 
                 # Set the last action, used for checking timeouts and re-orgs.
-                last = YieldAction(number=block.number, hash=block.hash, time=time.time())
+                last = _YieldAction(number=block.number, hash=block.hash, time=time.time())
 
     def poll_logs(
         self,
@@ -1138,34 +1435,122 @@ class Web3Provider(ProviderAPI, ABC):
         stop_block = min(stop_block_arg, height)
         block_ranges = self.block_ranges(start_block, stop_block, self.block_page_size)
 
-        def fetch_log_page(block_range):
+        def get_page_params(block_range) -> dict:
             start, stop = block_range
             update = {"start_block": start, "stop_block": stop}
             page_filter = log_filter.model_copy(update=update)
 
             # NOTE: Using JSON mode since used as request data.
-            filter_params = page_filter.model_dump(mode="json")
-            logs = self.make_request("eth_getLogs", [filter_params])
+            return page_filter.model_dump(mode="json")
+
+        def fetch_log_page(block_range):
+            logs = self.make_request("eth_getLogs", [get_page_params(block_range)])
             return self.network.ecosystem.decode_logs(logs, *log_filter.events)
 
-        with ThreadPoolExecutor(self.concurrency) as pool:
-            for page in pool.map(fetch_log_page, block_ranges):
-                yield from page
+        def stream_log_page(block_range):
+            # perf: Decode the logs while the response streams in, so the raw
+            #   response and all of its log dicts are never in memory at once.
+            def get_logs():
+                logs = self.stream_request("eth_getLogs", [get_page_params(block_range)])
+                return list(self.network.ecosystem.decode_logs(logs, *log_filter.events))
+
+            return request_with_retry(get_logs)
+
+        if self.http_uri and self._supports_batch_requests is not False:
+            # perf: Request several pages in a single JSON-RPC batch (one round trip)
+            #   rather than one HTTP request per page.
+            block_ranges = iter(block_ranges)
+            batch_size = max(self.concurrency, 1)
+            batches = iter(lambda: list(islice(block_ranges, batch_size)), [])
+            pool = self._get_log_pool()
+
+            def send_page_batch(batch_ranges: list) -> list:
+                calls = [("eth_getLogs", [get_page_params(r)]) for r in batch_ranges]
+                return self.send_batch(calls)
+
+            batch = next(batches, [])
+            pages_future: Optional[Future] = pool.submit(send_page_batch, batch) if batch else None
+            try:
+                while pages_future is not None:
+                    try:
+                        pages = pages_future.result()
+                    except (ProviderError, APINotImplementedError) as err:
+                        # NOTE: Only give up on batching when the error says batching is the
+                        #   problem; other errors (e.g. too many results) would happen anyway.
+                        if self._supports_batch_requests or not _is_batch_not_supported_error(err):
+                            raise
+
+                        pages = []
+
+                    if len(pages) != len(batch):
+                        # The provider does not support batching. Use the thread-pool instead.
+                        self._supports_batch_requests = False
+                        block_ranges = chain(batch, block_ranges)
+                        break
+
+                    self._supports_batch_requests = True
+
+                    # perf: Request the next batch while this one is decoded and consumed.
+                    batch = next(batches, [])
+                    pages_future = pool.submit(send_page_batch, batch) if batch else None
+                    for logs in pages:
+                        yield from self.network.ecosystem.decode_logs(logs, *log_filter.events)
+
+                else:
+                    return
+
+            finally:
+                # In case the caller stopped iterating early.
+                if pages_future is not None:
+                    pages_future.cancel()
+
+        # NOTE: Only keep a bounded number of pages in-flight (rather than `pool.map()`,
+        #   which submits every page up-front) so large ranges do not buffer all logs
+        #   in memory before the caller consumes them. Pages are yielded in order.
+        max_pending = max(self.concurrency, 1) * 2
+        get_page = stream_log_page if self.http_uri else fetch_log_page
+        pool = self._get_log_pool()
+        pending: deque = deque()
+        try:
+            for block_range in block_ranges:
+                pending.append(pool.submit(get_page, block_range))
+                if len(pending) >= max_pending:
+                    yield from pending.popleft().result()
+
+            while pending:
+                yield from pending.popleft().result()
+
+        finally:
+            # In case the caller stopped iterating early.
+            for future in pending:
+                future.cancel()
+
+    def _get_log_pool(self) -> ThreadPoolExecutor:
+        # perf: Re-use the worker threads across calls rather than starting
+        #   (and joining) a new pool every time logs are requested.
+        pool = self._log_pool
+        if pool is None or self._log_pool_size != self.concurrency:
+            if pool is not None:
+                pool.shutdown(wait=False)
+
+            pool = ThreadPoolExecutor(self.concurrency, thread_name_prefix="ape-logs")
+            self._log_pool = pool
+            self._log_pool_size = self.concurrency
+
+        return pool
 
     def prepare_transaction(self, txn: TransactionAPI) -> TransactionAPI:
         # NOTE: Use "expected value" for Chain ID, so if it doesn't match actual, we raise
         txn.chain_id = self.network.chain_id
 
-        from ape_ethereum.transactions import StaticFeeTransaction, TransactionType
-
-        txn_type = TransactionType(txn.type)
+        txn_type = txn.type
         if (
-            txn_type in (TransactionType.STATIC, TransactionType.ACCESS_LIST)
+            txn_type in _STATIC_FEE_TXN_TYPES
             and isinstance(txn, StaticFeeTransaction)
             and txn.gas_price is None
         ):
             txn.gas_price = self.gas_price
-        elif txn_type in (TransactionType.DYNAMIC, TransactionType.SHARED_BLOB):
+        elif txn_type in _DYNAMIC_FEE_TXN_TYPES:
             if txn.max_priority_fee is None:
                 txn.max_priority_fee = self.priority_fee
 
@@ -1175,7 +1560,7 @@ class Web3Provider(ProviderAPI, ABC):
 
             # else: Assume user specified the correct amount or txn will fail and waste gas
 
-        if txn_type is TransactionType.ACCESS_LIST and isinstance(txn, AccessListTransaction):
+        if txn_type == TransactionType.ACCESS_LIST.value and isinstance(txn, AccessListTransaction):
             if not txn.access_list:
                 try:
                     txn.access_list = self.create_access_list(txn)
@@ -1183,7 +1568,7 @@ class Web3Provider(ProviderAPI, ABC):
                     pass
 
         gas_limit = self.network.gas_limit if txn.gas_limit is None else txn.gas_limit
-        if gas_limit in (None, "auto") or isinstance(gas_limit, AutoGasLimit):
+        if gas_limit is None or gas_limit == "auto" or isinstance(gas_limit, AutoGasLimit):
             multiplier = (
                 gas_limit.multiplier
                 if isinstance(gas_limit, AutoGasLimit)
@@ -1196,12 +1581,12 @@ class Web3Provider(ProviderAPI, ABC):
 
             txn.gas_limit = gas
 
+        elif isinstance(gas_limit, int):
+            txn.gas_limit = gas_limit
+
         elif gas_limit == "max":
             txn.gas_limit = self.max_gas
 
-        elif gas_limit is not None and isinstance(gas_limit, int):
-            txn.gas_limit = gas_limit
-
         if txn.required_confirmations is None:
             txn.required_confirmations = self.network.required_confirmations
         elif not isinstance(txn.required_confirmations, int) or txn.required_confirmations < 0:
@@ -1211,7 +1596,8 @@ class Web3Provider(ProviderAPI, ABC):
 
     def send_transaction(self, txn: TransactionAPI) -> ReceiptAPI:
         vm_err = None
-        txn_data = None
+        # NOTE: A new block is expected after sending, so stop using the cached one.
+        self._latest_block_cache = None
         try:
             txn_hash = self._send_transaction(txn)
         except (Web3RPCError, Web3ContractLogicError) as err:
@@ -1228,7 +1614,8 @@ class Web3Provider(ProviderAPI, ABC):
             if txn.required_confirmations is not None
             else self.network.required_confirmations
         )
-        txn_data = txn_data or txn.model_dump(by_alias=True, mode="json")
+        # NOTE: Dumped once; also used as the call params if replaying a revert.
+        txn_data = txn.model_dump(by_alias=True, mode="json")
 
         # Signature is excluded from the model fields, so we have to include it manually.
         txn_data["signature"] = txn.signature
@@ -1254,7 +1641,8 @@ class Web3Provider(ProviderAPI, ABC):
         # NOTE: Caching must happen before error enrichment.
         self.chain_manager.history.append(receipt)
 
-        if receipt.failed:
+        # NOTE: Only replay when the revert is not already known from sending.
+        if receipt.failed and receipt.error is None:
             # For some reason, some nodes have issues with integer-types.
             if isinstance(txn_data.get("type"), int):
                 txn_data["type"] = to_hex(txn_data["type"])
@@ -1337,16 +1725,11 @@ class Web3Provider(ProviderAPI, ABC):
         try:
             result = self.web3.provider.make_request(RPCEndpoint(rpc), parameters)
         except HTTPError as err:
-            if "method not allowed" in str(err).lower():
-                raise APINotImplementedError(
-                    f"RPC method '{rpc}' is not implemented by this node instance."
-                )
+            _raise_http_error(rpc, err)
 
-            elif err.response.status_code == 429:
-                raise  # Raise as-is so rate-limit handling picks it up.
-
-            raise ProviderError(str(err)) from err
+        return self._get_rpc_result(rpc, result)
 
+    def _get_rpc_result(self, rpc: str, result: Any) -> Any:
         if "error" in result:
             error = result["error"]
             message = (
@@ -1365,10 +1748,116 @@ class Web3Provider(ProviderAPI, ABC):
 
             raise ProviderError(message)
 
-        elif "result" in result:
-            return result.get("result", {})
+        # perf: Most responses have a result, so avoid checking for it first.
+        try:
+            return result["result"]
+        except (KeyError, TypeError):
+            return result
 
-        return result
+    def send_batch(self, calls: list[tuple[str, list]]) -> list[Any]:
+        if not calls:
+            return []
+
+        elif not (uri := self.http_uri):
+            # Batching requires raw HTTP access; send the requests one at a time.
+            return [self.make_request(rpc, params) for rpc, params in calls]
+
+        payload = [
+            {"jsonrpc": "2.0", "id": idx, "method": rpc, "params": params}
+            for idx, (rpc, params) in enumerate(calls)
+        ]
+
+        def post_batch():
+            response = self.http_session.post(uri, json=payload, timeout=_DEFAULT_HTTP_TIMEOUT)
+            response.raise_for_status()
+            return response.json()
+
+        try:
+            results = request_with_retry(post_batch)
+        except HTTPError as err:
+            raise ProviderError(str(err)) from err
+
+        if not isinstance(results, list):
+            # Likely an error for the whole batch (e.g. batching not supported).
+            if isinstance(results, dict):
+                self._get_rpc_result(calls[0][0], results)
+
+            raise ProviderError(f"Expected a list of {len(calls)} batch responses.")
+
+        # NOTE: Responses are not guaranteed to be in the same order as the requests.
+        responses = {}
+        for response in results:
+            if (response_id := response.get("id")) is None:
+                # NOTE: Errors for requests the node could not parse have a null ID.
+                self._get_rpc_result(calls[0][0], response)
+                continue
+
+            responses[response_id] = response
+
+        output = []
+        for idx, (rpc, _) in enumerate(calls):
+            if (response := responses.get(idx)) is None:
+                raise ProviderError(f"Missing batch response for '{rpc}' (id={idx}).")
+
+            output.append(self._get_rpc_result(rpc, response))
+
+        return output
+
+    def get_codes(
+        self, addresses: Iterable["AddressType"], block_id: Optional["BlockID"] = None
+    ) -> list["ContractCode"]:
+        block_param = _get_block_param(block_id)
+        results = self.send_batch([("eth_getCode", [a, block_param]) for a in addresses])
+        return [HexBytes(r) for r in results]
+
+    def get_balances(
+        self, addresses: Iterable["AddressType"], block_id: Optional["BlockID"] = None
+    ) -> list[int]:
+        block_param = _get_block_param(block_id)
+        results = self.send_batch([("eth_getBalance", [a, block_param]) for a in addresses])
+        return [to_int(r) for r in results]
+
+    def get_nonces(
+        self, addresses: Iterable["AddressType"], block_id: Optional["BlockID"] = None
+    ) -> list[int]:
+        block_param = _get_block_param(block_id)
+        results = self.send_batch(
+            [("eth_getTransactionCount", [a, block_param]) for a in addresses]
+        )
+        return [to_int(r) for r in results]
+
+    def prefetch_account(
+        self, address: "AddressType", block_id: Optional["BlockID"] = None
+    ) -> tuple[int, int, int, int]:
+        """
+        Get the values typically needed when building a transaction for an account,
+        in a single batch request. The gas price is also cached (briefly, on live
+        networks) so the following transaction build can use it.
+
+        Args:
+            address (:class:`~ape.types.address.AddressType`): The account address.
+            block_id (Optional[:class:`~ape.types.BlockID`]): The block ID
+              for the nonce and balance. Defaults to the latest block.
+
+        Returns:
+            tuple[int, int, int, int]: The nonce, balance, chain ID, and gas price.
+        """
+        block_param = _get_block_param(block_id)
+        nonce, balance, chain_id, gas_price = (
+            to_int(r)
+            for r in self.send_batch(
+                [
+                    ("eth_getTransactionCount", [address, block_param]),
+                    ("eth_getBalance", [address, block_param]),
+                    ("eth_chainId", []),
+                    ("eth_gasPrice", []),
+                ]
+            )
+        )
+        if not self.network.is_dev:
+            self._gas_cache["gas_price"] = (time.monotonic(), gas_price)
+
+        return nonce, balance, chain_id, gas_price
 
     def stream_request(self, method: str, params: Iterable, iter_path: str = "result.item"):
         if not (uri := self.http_uri):
@@ -1377,11 +1866,18 @@ class Web3Provider(ProviderAPI, ABC):
         payload = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}
         results = ijson.sendable_list()
         coroutine = ijson.items_coro(results, iter_path)
-        resp = requests.post(uri, json=payload, stream=True)
+        errors = ijson.sendable_list()
+        error_coroutine = ijson.items_coro(errors, "error")
+        resp = self.http_session.post(uri, json=payload, stream=True)
         resp.raise_for_status()
 
         for chunk in resp.iter_content(chunk_size=2**17):
             coroutine.send(chunk)
+            error_coroutine.send(chunk)
+            if errors:
+                # NOTE: Raises the appropriate error.
+                self._get_rpc_result(method, {"error": errors[0]})
+
             yield from results
             del results[:]
 
@@ -1584,16 +2080,21 @@ class EthereumNodeProvider(Web3Provider, ABC):
         return None
 
     def _set_web3(self):
-        # Clear cached version when connecting to another URI.
+        # Clear cached values when connecting to another URI.
         self._client_version = None
+        self._clear_rpc_caches()
         headers = self.network_manager.get_request_headers(
             self.network.ecosystem.name, self.network.name, self.name
         )
+        http_uri = self.http_uri
         self._web3 = _create_web3(
-            http_uri=self.http_uri,
+            http_uri=http_uri,
             ipc_path=self.ipc_path,
             ws_uri=self.ws_uri,
             request_kwargs={"headers": headers},
+            # perf: Share the pooled keep-alive session so RPC POSTs re-use
+            #   open TCP/TLS connections instead of web3's default session.
+            session=self.http_session if http_uri else None,
         )
 
     def _complete_connect(self):
@@ -1663,8 +2164,9 @@ class EthereumNodeProvider(Web3Provider, ABC):
 
     def disconnect(self):
         self._call_trace_approach = None
-        self._web3 = None
+        self._supports_tracing = None
         self._client_version = None
+        super().disconnect()
 
     def _log_connection(self, client_name: str):
         msg = f"Connecting to existing {client_name.strip()} node at"
@@ -1703,11 +2205,85 @@ class EthereumNodeProvider(Web3Provider, ABC):
         self._complete_connect()
 
 
+def _prepare_eth_call_arguments(arguments: list) -> list:
+    # Force the usage of hex-type to support a wider-range of nodes.
+    txn_dict = copy(arguments[0])
+    if isinstance(txn_dict.get("type"), int):
+        txn_dict["type"] = to_hex(txn_dict["type"])
+
+    # Remove unnecessary values to support a wider-range of nodes.
+    txn_dict.pop("chainId", None)
+
+    arguments[0] = txn_dict
+    return arguments
+
+
+def _is_batch_not_supported_error(err: Exception) -> bool:
+    if isinstance(err, APINotImplementedError):
+        # E.g. the node treated the batch (a list) as an unknown method.
+        return True
+
+    message = str(err).lower()
+    return "batch" in message or "method not allowed" in message
+
+
+def _raise_http_error(rpc: str, err: HTTPError) -> NoReturn:
+    if "method not allowed" in str(err).lower():
+        raise APINotImplementedError(
+            f"RPC method '{rpc}' is not implemented by this node instance."
+        )
+
+    elif err.response is not None and err.response.status_code == 429:
+        raise err  # Raise as-is so rate-limit handling picks it up.
+
+    raise ProviderError(str(err)) from err
+
+
+def _get_block_hash_key(block_id: Optional["BlockID"]) -> Optional[bytes]:
+    # Returns the block hash as bytes if the given ID is a block hash, else ``None``.
+    if isinstance(block_id, bytes):
+        return bytes(block_id) if len(block_id) == 32 else None
+
+    elif isinstance(block_id, str) and len(block_id) == 66 and is_0x_prefixed(block_id):
+        try:
+            return bytes.fromhex(block_id[2:])
+        except ValueError:
+            return None
+
+    return None
+
+
+def _get_block_param(block_id: Optional["BlockID"]) -> str:
+    # Converts a block ID to the form expected in raw RPC params.
+    if block_id is None:
+        return "latest"
+
+    elif isinstance(block_id, int):
+        return to_hex(block_id)
+
+    elif isinstance(block_id, bytes):
+        return to_hex(block_id)
+
+    elif isinstance(block_id, str) and block_id.isdecimal():
+        return to_hex(int(block_id))
+
+    return block_id
+
+
+def _set_bounded(cache: dict, key: Any, value: Any):
+    # Insert into the cache, evicting the oldest entry when full.
+    if len(cache) >= _MAX_RPC_CACHE_SIZE:
+        cache.pop(next(iter(cache)))
+
+    cache[key] = value
+
+
 def _create_web3(
     http_uri: Optional[str] = None,
     ipc_path: Optional[Path] = None,
     ws_uri: Optional[str] = None,
     request_kwargs: Optional[dict] = None,
+    session: Optional[Session] = None,
 ):
     # NOTE: This list is ordered by try-attempt.
     # Try ENV, then IPC, and then HTTP last.
@@ -1717,9 +2293,11 @@ def _create_web3(
     if http := http_uri:
         request_kwargs = request_kwargs or {}
         if "timeout" not in request_kwargs:
-            request_kwargs["timeout"] = 30 * 60
+            request_kwargs["timeout"] = _DEFAULT_HTTP_TIMEOUT
 
-        providers.append(lambda: HTTPProvider(endpoint_uri=http, request_kwargs=request_kwargs))
+        providers.append(
+            lambda: HTTPProvider(endpoint_uri=http, request_kwargs=request_kwargs, session=session)
+        )
     if ws := ws_uri:
         providers.append(lambda: WebsocketProvider(endpoint_uri=ws))
 
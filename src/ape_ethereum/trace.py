@@ -19,7 +19,6 @@ from evm_trace import (
     get_calltree_from_geth_trace,
     get_calltree_from_parity_trace,
 )
-from evm_trace.gas import merge_reports
 from hexbytes import HexBytes
 from pydantic import field_validator
 from rich.tree import Tree
@@ -42,7 +41,9 @@ if TYPE_CHECKING:
 
 _INDENT = 2
 _WRAP_THRESHOLD = 50
+_SHORT_SEQUENCE_LENGTH = 8
 _REVERT_PREFIX = "0x08c379a00000000000000000000000000000000000000000000000000000000000000020"
+_REVERT_PREFIX_BYTES = bytes.fromhex(_REVERT_PREFIX[2:])
 
 
 class TraceApproach(Enum):
@@ -100,6 +101,7 @@ class Trace(TraceAPI):
     """When None, attempts to deduce."""
 
     _enriched_calltree: Optional[dict] = None
+    _gas_reports: dict[frozenset[tuple[str, Optional[str]]], "GasReport"] = {}
 
     def __repr__(self) -> str:
         try:
@@ -153,7 +155,7 @@ class Trace(TraceAPI):
             return self._enriched_calltree
 
         # Side-effect: sets `_enriched_calltree` if using Ethereum node provider.
-        self.provider.network.ecosystem.enrich_trace(self)
+        self._ecosystem.enrich_trace(self)
 
         if self._enriched_calltree is None:
             # If still None (shouldn't be), set to avoid repeated attempts.
@@ -202,8 +204,9 @@ class Trace(TraceAPI):
 
         return None
 
-    @property
+    @cached_property
     def _ecosystem(self) -> "EcosystemAPI":
+        # perf: Cached since it is used per address when walking frames.
         if provider := self.network_manager.active_provider:
             return provider.network.ecosystem
 
@@ -219,11 +222,13 @@ class Trace(TraceAPI):
             # Don't need to run whole list.
             frames = self.frames
 
+        # perf: Bind once rather than per frame (there can be a lot of frames).
+        decode_address = self._ecosystem.decode_address
         for frame in frames:
             if not (addr := frame.address):
                 continue
 
-            yield self._ecosystem.decode_address(addr)
+            yield decode_address(addr)
 
     @cached_property
     def return_value(self) -> Any:
@@ -370,46 +375,76 @@ class Trace(TraceAPI):
     def get_gas_report(
         self, exclude: Optional[Sequence["ContractFunctionPath"]] = None
     ) -> "GasReport":
-        call = self.enriched_calltree
-        return self._get_gas_report_from_call(call, exclude=exclude)
+        # perf: The call tree doesn't change once traced, so cache the report
+        #   per set of exclusions (their order does not matter).
+        key = frozenset((x.contract_name, x.method_name) for x in exclude or [])
+        if key not in self._gas_reports:
+            call = self.enriched_calltree
+            self._gas_reports[key] = self._get_gas_report_from_call(call, exclude=exclude)
+
+        # NOTE: Copy the gas lists so callers merging reports can't change the cache.
+        return {
+            contract_id: {method_id: [*gas] for method_id, gas in methods.items()}
+            for contract_id, methods in self._gas_reports[key].items()
+        }
 
     def _get_gas_report_from_call(
         self, call: dict, exclude: Optional[Sequence["ContractFunctionPath"]] = None
     ) -> "GasReport":
+        # perf: Collect into a single report in one (iterative, post-order) pass.
+        #   Merging the sub-reports at every level deep-copied them again for each
+        #   ancestor, which made deep call trees quadratic.
         tx = self.transaction
-
-        # Enrich transfers.
-        contract_id = call.get("contract_id", "")
-        is_transfer = contract_id.startswith("__") and contract_id.endswith("transfer__")
-        if is_transfer and tx.get("to") is not None and tx["to"] in self.account_manager:
-            receiver_id = self.account_manager[tx["to"]].alias or tx["to"]
-            call["method_id"] = f"to:{receiver_id}"
-
-        elif is_transfer and (receiver := tx.get("to")):
-            call["method_id"] = f"to:{receiver}"
-
         exclusions = exclude or []
-        calls = call.get("calls", [])
-        sub_reports = (self._get_gas_report_from_call(c, exclude=exclusions) for c in calls)
+        report: "GasReport" = {}
+        # perf: Whether to skip only depends on the contract and method IDs, which
+        #   repeat a lot within a tree, so only match the exclusions once per pair.
+        skipped: dict[tuple[str, str], bool] = {}
+        # NOTE: The same for every transfer in the tree; computed on the first one
+        #   because checking the account containers is not cheap.
+        transfer_method_id: Optional[str] = None
+        stack: list[tuple[dict, bool]] = [(call, False)]
+        while stack:
+            node, sub_calls_added = stack.pop()
+            contract_id = node.get("contract_id", "")
+            if not sub_calls_added:
+                # Enrich transfers.
+                if contract_id.startswith("__") and contract_id.endswith("transfer__"):
+                    if transfer_method_id is None:
+                        receiver = tx.get("to")
+                        if receiver is not None and receiver in self.account_manager:
+                            receiver = self.account_manager[receiver].alias or receiver
+
+                        transfer_method_id = f"to:{receiver}" if receiver else ""
+
+                    if transfer_method_id:
+                        node["method_id"] = transfer_method_id
+
+                # Sub-calls are reported before their caller.
+                stack.append((node, True))
+                stack.extend((c, False) for c in reversed(node.get("calls", [])))
+                continue
 
-        if (
-            not call.get("contract_id")
-            or not call.get("method_id")
-            or _exclude_gas(exclusions, call.get("contract_id", ""), call.get("method_id", ""))
-        ):
-            return merge_reports(*sub_reports)
+            # NOTE: Excluding a contract only skips its own calls; calls it makes to
+            #   other contracts are separate nodes and still get reported.
+            method_id = node.get("method_id", "")
+            if (skip := skipped.get((contract_id, method_id))) is None:
+                skip = skipped[(contract_id, method_id)] = bool(
+                    not contract_id
+                    or not method_id
+                    or is_zero_hex(method_id)
+                    or is_evm_precompile(method_id)
+                    or _exclude_gas(exclusions, contract_id, method_id)
+                )
+
+            if skip:
+                continue
 
-        elif not is_zero_hex(call["method_id"]) and not is_evm_precompile(call["method_id"]):
-            report: "GasReport" = {
-                call["contract_id"]: {
-                    call["method_id"]: (
-                        [int(call["gas_cost"])] if call.get("gas_cost") is not None else []
-                    )
-                }
-            }
-            return merge_reports(*sub_reports, report)
+            gas_costs = report.setdefault(contract_id, {}).setdefault(method_id, [])
+            if node.get("gas_cost") is not None:
+                gas_costs.append(int(node["gas_cost"]))
 
-        return merge_reports(*sub_reports)
+        return report
 
     def show_gas_report(self, verbose: bool = False, file: IO[str] = sys.stdout):
         gas_report = self.get_gas_report()
@@ -463,6 +498,13 @@ class TransactionTrace(Trace):
     transaction_hash: HexStr
     debug_trace_transaction_parameters: dict = {"enableMemory": True}
     _frames: list[dict] = []
+    _frames_stream: Optional[Iterator[dict]] = None
+    _frames_complete: bool = False
+    _parity_frames: Optional[list[dict]] = None
+    """
+    Set when the trace frames were fetched with the rest of the block
+    (see ``Web3Provider.get_transaction_traces_by_block()``).
+    """
 
     @property
     def raw_trace_frames(self) -> Iterator[dict]:
@@ -470,13 +512,30 @@ class TransactionTrace(Trace):
         The raw trace ``"structLogs"`` from ``debug_traceTransaction``
         for deeper investigation.
         """
-        if self._frames:
-            yield from self._frames
+        # perf: The frames are streamed from the provider once and cached as they
+        #   are consumed. Later iterations replay the cache and only resume the
+        #   stream where an earlier, partial iteration left off.
+        index = 0
+        while True:
+            if index < len(self._frames):
+                yield self._frames[index]
+                index += 1
+                continue
 
-        else:
-            for frame in self._stream_struct_logs():
-                self._frames.append(frame)
-                yield frame
+            elif self._frames_complete:
+                return
+
+            if self._frames_stream is None:
+                self._frames_stream = self._stream_struct_logs()
+
+            try:
+                frame = next(self._frames_stream)
+            except StopIteration:
+                self._frames_complete = True
+                self._frames_stream = None
+                return
+
+            self._frames.append(frame)
 
     @cached_property
     def transaction(self) -> dict:
@@ -554,13 +613,16 @@ class TransactionTrace(Trace):
         return get_calltree_from_geth_call_trace(data)
 
     def _trace_transaction(self) -> CallTreeNode:
-        try:
-            data = self.provider.make_request("trace_transaction", [self.transaction_hash])
-        except ProviderError as err:
-            if "transaction not found" in str(err).lower():
-                raise TransactionNotFoundError(transaction_hash=self.transaction_hash) from err
+        if self._parity_frames is not None:
+            data = self._parity_frames
+        else:
+            try:
+                data = self.provider.make_request("trace_transaction", [self.transaction_hash])
+            except ProviderError as err:
+                if "transaction not found" in str(err).lower():
+                    raise TransactionNotFoundError(transaction_hash=self.transaction_hash) from err
 
-            raise  # The ProviderError as-is
+                raise  # The ProviderError as-is
 
         parity_objects = ParityTraceList.model_validate(data)
         return get_calltree_from_parity_trace(parity_objects)
@@ -663,21 +725,31 @@ class CallTrace(Trace):
 
 
 def parse_rich_tree(call: dict, verbose: bool = False) -> Tree:
-    tree = _create_tree(call, verbose=verbose)
-    for event in call.get("events", []):
-        if "calldata" not in event and "name" not in event:
-            # Not sure; or not worth showing.
-            logger.debug(f"Unknown event data: '{event}'.")
-            continue
+    # perf: Walk the calls with an explicit stack rather than recursing, so deep
+    #   call trees don't pay per-level call overhead or hit the recursion limit.
+    root = _create_tree(call, verbose=verbose)
+    stack = [(call, root)]
+    while stack:
+        node, tree = stack.pop()
+        for event in node.get("events", []):
+            if "calldata" not in event and "name" not in event:
+                # Not sure; or not worth showing.
+                logger.debug(f"Unknown event data: '{event}'.")
+                continue
+
+            event_tree = _create_event_tree(event)
+            tree.add(event_tree)
 
-        event_tree = _create_event_tree(event)
-        tree.add(event_tree)
+        sub_nodes = []
+        for sub_call in node.get("calls", []):
+            sub_tree = _create_tree(sub_call, verbose=verbose)
+            tree.add(sub_tree)
+            sub_nodes.append((sub_call, sub_tree))
 
-    for sub_call in call.get("calls", []):
-        sub_tree = parse_rich_tree(sub_call, verbose=verbose)
-        tree.add(sub_tree)
+        # Reversed so sub-calls are visited in order.
+        stack.extend(reversed(sub_nodes))
 
-    return tree
+    return root
 
 
 def _events_to_trees(events: list[dict]) -> list[Tree]:
@@ -727,10 +799,11 @@ def _call_to_str(call: dict, stylize: bool = False, verbose: bool = False) -> st
         if is_create and call["method_id"] and is_0x_prefixed(call["method_id"])
         else str(call.get("method_id") or "")
     )
-    if "(" in method:
+    if (paren_index := method.find("(")) != -1:
         # Only show short name, not ID name
         # (it is the full signature when multiple methods have the same name).
-        method = method.split("(")[0].strip() or method
+        # perf: Slice at the first paren rather than splitting the whole signature.
+        method = method[:paren_index].strip() or method
 
     if stylize:
         contract = f"[{TraceStyles.CONTRACTS}]{contract}[/]"
@@ -826,35 +899,33 @@ def _get_outputs_str(outputs: Any, stylize: bool = False) -> Optional[str]:
 
 
 def _dict_to_str(dictionary: dict, color: Optional[str] = None) -> str:
-    length = sum(len(str(v)) for v in [*dictionary.keys(), *dictionary.values()])
+    # perf: Stringify each value once; the strings serve both the length probe
+    #   and the output below.
+    value_strs = [str(v) for v in dictionary.values()]
+    length = sum(len(str(k)) for k in dictionary) + sum(len(v) for v in value_strs)
     do_wrap = length > _WRAP_THRESHOLD
 
-    index = 0
-    end_index = len(dictionary) - 1
-    kv_str = "(\n" if do_wrap else "("
-
-    for key, value in dictionary.items():
-        if do_wrap:
-            kv_str += _INDENT * " "
-
+    items = []
+    for (key, value), value_str in zip(dictionary.items(), value_strs):
         if isinstance(value, (list, tuple)):
-            value = _list_to_str(value, 1 if do_wrap else 0)
+            value_str = _list_to_str(value, 1 if do_wrap else 0)
 
-        value_str = f"[{color}]{value}[/]" if color is not None else str(value)
-        kv_str += f"{key}={value_str}" if key and not key.isnumeric() else value_str
-        if index < end_index:
-            kv_str += ", "
+        if color is not None:
+            value_str = f"[{color}]{value_str}[/]"
 
-        if do_wrap:
-            kv_str += "\n"
+        items.append(f"{key}={value_str}" if key and not key.isnumeric() else value_str)
 
-        index += 1
+    # perf: Join the parts once rather than concatenating in the loop.
+    if do_wrap:
+        indent = _INDENT * " "
+        joined = ", \n".join(f"{indent}{item}" for item in items)
+        return f"(\n{joined}\n)"
 
-    return f"{kv_str})"
+    return f"({', '.join(items)})"
 
 
 def _list_to_str(ls: Union[list, tuple], depth: int = 0) -> str:
-    if not isinstance(ls, (list, tuple)) or len(str(ls)) < _WRAP_THRESHOLD:
+    if not isinstance(ls, (list, tuple)) or not _str_len_exceeds(ls, _WRAP_THRESHOLD - 1):
         return str(ls)
 
     elif ls and isinstance(ls[0], (list, tuple)):
@@ -863,7 +934,7 @@ def _list_to_str(ls: Union[list, tuple], depth: int = 0) -> str:
 
         # Use multi-line if exceeds threshold OR any of the sub-lists use multi-line
         extra_chars_len = (len(sub_lists) - 1) * 2
-        use_multiline = len(str(sub_lists)) + extra_chars_len > _WRAP_THRESHOLD or any(
+        use_multiline = _str_len_exceeds(sub_lists, _WRAP_THRESHOLD - extra_chars_len) or any(
             ["\n" in ls for ls in sub_lists]
         )
 
@@ -871,29 +942,55 @@ def _list_to_str(ls: Union[list, tuple], depth: int = 0) -> str:
             # Happens for lists like '[[0], [1]]' that are short.
             return f"[{', '.join(sub_lists)}]"
 
-        value = "[\n"
-        num_sub_lists = len(sub_lists)
-        index = 0
         spacing = _INDENT * " " * 2
+        lines = []
         for formatted_list in sub_lists:
             if "\n" in formatted_list:
                 # Multi-line sub list. Append 1 more spacing to each line.
                 indented_item = f"\n{spacing}".join(formatted_list.splitlines())
-                value = f"{value}{spacing}{indented_item}"
+                lines.append(f"{spacing}{indented_item}")
             else:
                 # Single line sub-list
-                value = f"{value}{spacing}{formatted_list}"
+                lines.append(f"{spacing}{formatted_list}")
 
-            if index < num_sub_lists - 1:
-                value = f"{value},"
+        joined = ",\n".join(lines)
+        return f"[\n{joined}\n]"
 
-            value = f"{value}\n"
-            index += 1
+    return _list_to_multiline_str(ls, depth=depth)
 
-        value = f"{value}]"
-        return value
 
-    return _list_to_multiline_str(ls, depth=depth)
+def _str_len_exceeds(value: Any, limit: int) -> bool:
+    # perf: Same as `len(str(value)) > limit`, but stops stringifying list items
+    #   once past the limit rather than building the repr of a (huge) array.
+    #   Short sequences are quicker to just stringify.
+    if type(value) not in (list, tuple) or len(value) <= _SHORT_SEQUENCE_LENGTH:
+        return len(str(value)) > limit
+
+    return _repr_len(value, limit) > limit
+
+
+def _repr_len(value: Any, limit: int) -> int:
+    # NOTE: Only exact lists and tuples; subclasses (e.g. named tuples) may have
+    #   their own repr. Returns early (with a length > limit) once past the limit.
+    value_type = type(value)
+    if value_type is list:
+        length = 2
+    elif value_type is tuple:
+        # Single-item tuples get a trailing comma, e.g. `(1,)`.
+        length = 3 if len(value) == 1 else 2
+    else:
+        return len(repr(value))
+
+    for index, item in enumerate(value):
+        if index:
+            # Separator ", ".
+            length += 2
+
+        length += _repr_len(item, limit - length)
+        if length > limit:
+            break
+
+    return length
 
 
 def _list_to_multiline_str(value: Union[list, tuple], depth: int = 0) -> str:
@@ -3,7 +3,6 @@ from enum import Enum, IntEnum
 from functools import cached_property
 from typing import IO, TYPE_CHECKING, Any, Optional, Union
 
-from eth_abi import decode
 from eth_account import Account as EthAccount
 from eth_account._utils.legacy_transactions import (
     encode_transaction,
@@ -21,6 +20,7 @@ from ape.types.address import AddressType
 from ape.types.basic import HexInt
 from ape.types.events import ContractLog, ContractLogContainer
 from ape.types.trace import SourceTraceback
+from ape.utils.abi import decode_abi
 from ape.utils.misc import ZERO_ADDRESS
 from ape_ethereum.trace import Trace, _events_to_trees
 
@@ -404,7 +404,7 @@ class Receipt(ReceiptAPI):
         data = decode_hex(log["data"]) if isinstance(log["data"], str) else log["data"]
         input_types = [i.canonical_type for i in method_abi.inputs]
         start_index = data.index(selector) + 4
-        values = decode(input_types, data[start_index:])
+        values = decode_abi(input_types, data[start_index:])
         address = self.provider.network.ecosystem.decode_address(log["address"])
 
         return ContractLog(
@@ -19,7 +19,7 @@ from ape.exceptions import VirtualMachineError
 from ape.logging import LogLevel, logger
 from ape.utils._web3_compat import ExtraDataToPOAMiddleware
 from ape.utils.misc import ZERO_ADDRESS, log_instead_of_fail, raises_not_implemented
-from ape.utils.process import JoinableQueue, spawn
+from ape.utils.process import spawn
 from ape.utils.testing import (
     DEFAULT_NUMBER_OF_TEST_ACCOUNTS,
     DEFAULT_TEST_ACCOUNT_BALANCE,
@@ -464,16 +464,13 @@ class GethDev(EthereumNodeProvider, TestProviderAPI, SubprocessProvider):
 
         # For subprocess-provider
         if self._process is not None and (process := self._process.proc):
-            self.stderr_queue = JoinableQueue()
-            self.stdout_queue = JoinableQueue()
-
             self.process = process
 
-            # Start listening to output.
-            spawn(self.produce_stdout_queue)
-            spawn(self.produce_stderr_queue)
-            spawn(self.consume_stdout_queue)
-            spawn(self.consume_stderr_queue)
+            # Start listening to output (only piped when debug-logging).
+            if process.stdout is not None:
+                spawn(self._pump_stream, process.stdout, self._stdout_logger)
+            if process.stderr is not None:
+                spawn(self._pump_stream, process.stderr, self._stderr_logger)
 
     def _create_process(self) -> GethDevProcess:
         # NOTE: Using JSON mode to ensure types can be passed as CLI args.
@@ -204,7 +204,7 @@ class LocalProvider(TestProviderAPI, Web3Provider):
 
     def disconnect(self):
         # NOTE: This type ignore seems like a bug in pydantic.
-        self._web3 = None
+        super().disconnect()
         self._evm_backend = None
         self.provider_settings = {}
 
@@ -18,6 +18,28 @@ def test_block(eth_tester_provider, vyper_contract_instance):
     assert actual.number == data["number"]
 
 
+def test_block_hash_from_hexbytes_is_not_copied(eth_tester_provider):
+    data = eth_tester_provider.web3.eth.get_block("latest")
+    actual = Block.model_validate(data)
+    assert actual.hash is data["hash"]
+    assert actual.parent_hash is data["parentHash"]
+
+
+def test_block_hash_from_str():
+    block_hash = f"0x{'ab' * 32}"
+    actual = Block.model_validate(
+        {"number": 1, "timestamp": 1, "gasLimit": 1, "gasUsed": 1, "hash": block_hash}
+    )
+    assert actual.hash == HexBytes(block_hash)
+
+
+def test_block_hash_from_float():
+    with pytest.raises(TypeError, match="Cannot convert 1.5 of type <class 'float'> to bytes"):
+        Block.model_validate(
+            {"number": 1, "timestamp": 1, "gasLimit": 1, "gasUsed": 1, "hash": 1.5}
+        )
+
+
 def test_repr(block):
     actual = repr(block)
     expected = f"<Block number={block.number} hash={to_hex(block.hash)}>"
@@ -6,6 +6,7 @@ import click
 import pytest
 from click import BadParameter
 
+from ape._cli import ApeCLI
 from ape.cli import (
     AccountAliasPromptChoice,
     ConnectedProviderCommand,
@@ -938,3 +939,21 @@ def test_config_override_option(runner):
     result = runner.invoke(cli, ("--config-override", '{"foo": "bar"}'))
     assert result.exit_code == 0
     assert not result.exception
+
+
+def test_ape_cli_commands():
+    cli = ApeCLI(name="ape")
+    commands = cli.list_commands(None)
+    assert "compile" in commands
+    assert commands == sorted(commands)
+    # Loaded from entry-points once.
+    assert cli.commands is cli.commands
+
+
+def test_ape_cli_suggest_cmd():
+    cli = ApeCLI(name="ape")
+    error = click.UsageError("No such command 'compil'.", ctx=click.Context(cli))
+    with pytest.raises(click.UsageError) as err:
+        cli._suggest_cmd(error)
+
+    assert err.value.message == "No such command 'compil'. Did you mean compile?"
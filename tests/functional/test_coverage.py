@@ -181,6 +181,55 @@ class TestCoverageData:
         actual = coverage_data.report
         assert isinstance(actual, CoverageReport)
 
+    def test_report_resolves_compiler_once_per_source(
+        self, mocker, project, contract_source, compilers, mock_compiler
+    ):
+        get_ext = mocker.patch(
+            "ape.pytest.coverage.get_full_extension", return_value=mock_compiler.ext
+        )
+        mocker.patch.dict(compilers.registered_compilers, {mock_compiler.ext: mock_compiler})
+
+        # Same source (e.g. with multiple contracts in it).
+        coverage_data = CoverageData(project, (contract_source, contract_source))
+        _ = coverage_data.report
+        assert get_ext.call_count == 1
+        assert mock_compiler.init_coverage_profile.call_count == 2
+
+    def test_cover(self, coverage_data, coverage_report, foo_function, bar_function):
+        coverage_data._report = coverage_report
+        src_path = coverage_data.project.path / "Contract.vy"
+
+        handled_pcs, functions = coverage_data.cover(src_path, [21, 30, 99])
+        assert handled_pcs == {21, 30}
+        assert functions == ["foo()", "bar()"]
+        assert [s.hit_count for s in foo_function.statements] == [STMT_0_HIT, STMT_1_HIT + 1, 1]
+        assert [s.hit_count for s in bar_function.statements] == [STMT_0_HIT + 1, STMT_1_HIT, 0]
+        assert foo_function.hit_count == 2
+        assert bar_function.hit_count == 1
+        assert coverage_data._source_ids == {src_path: "Contract.vy"}
+
+    def test_cover_after_reset(self, mocker, coverage_data, coverage_report):
+        mocker.patch.object(
+            coverage_data,
+            "_init_coverage_profile",
+            side_effect=lambda: coverage_report.model_copy(deep=True),
+        )
+        src_path = coverage_data.project.path / "Contract.vy"
+        coverage_data.cover(src_path, [21])
+        coverage_data.reset()
+        coverage_data.cover(src_path, [21])
+
+        # The hit goes into the new report, not the one from before the reset.
+        statements = (
+            coverage_data.report.projects[0].sources[0].contracts[0].functions[0].statements
+        )
+        assert [s.hit_count for s in statements] == [STMT_0_HIT, STMT_1_HIT + 1, 1]
+
+    def test_cover_untracked_source(self, coverage_data, coverage_report):
+        coverage_data._report = coverage_report
+        src_path = coverage_data.project.path / "Untracked.vy"
+        assert coverage_data.cover(src_path, [20, 21]) == (set(), [])
+
 
 class TestCoverageTracker:
     @pytest.fixture
@@ -13,7 +13,12 @@ from ape.api.networks import ForkedNetworkAPI, NetworkAPI
 from ape.exceptions import CustomError, DecodingError, NetworkError, NetworkNotFoundError
 from ape.types.address import AddressType
 from ape.types.units import CurrencyValueComparable
-from ape.utils.misc import DEFAULT_LOCAL_TRANSACTION_ACCEPTANCE_TIMEOUT, LOCAL_NETWORK_NAME
+from ape.utils.misc import (
+    DEFAULT_LOCAL_TRANSACTION_ACCEPTANCE_TIMEOUT,
+    LOCAL_NETWORK_NAME,
+    ZERO_ADDRESS,
+)
+from ape_ethereum import ecosystem as ecosystem_module
 from ape_ethereum.ecosystem import BLUEPRINT_HEADER, BaseEthereumConfig, Block, Ethereum
 from ape_ethereum.trace import TransactionTrace
 from ape_ethereum.transactions import (
@@ -741,6 +746,31 @@ def test_encode_blueprint_contract(ethereum, vyper_contract_type):
     assert actual.data == HexBytes(expected)
 
 
+def test_decode_calldata_unnamed_and_struct_inputs(ethereum):
+    inputs = [
+        {"name": "", "type": "uint256"},
+        {"name": "s", "type": "tuple", "components": [{"name": "x", "type": "uint8"}]},
+    ]
+    abi = make_method_abi("doThing", inputs=inputs)
+    calldata = HexBytes(5).rjust(32, b"\x00") + HexBytes(7).rjust(32, b"\x00")
+    expected = {"0": 5, "s": (7,)}
+    assert ethereum.decode_calldata(abi, calldata) == expected
+    # Again, with the ABI's derived types cached.
+    assert ethereum.decode_calldata(abi, calldata) == expected
+
+
+def test_get_abi_types_matches_parse_type():
+    inner = {"name": "i", "type": "tuple[2]", "components": [{"name": "x", "type": "bytes32"}]}
+    inputs = [
+        {"name": "a", "type": "address[]"},
+        {"name": "s", "type": "tuple[]", "components": [{"name": "y", "type": "uint8"}, inner]},
+    ]
+    abi = make_method_abi("doThing", inputs=inputs)
+    _, parsed_types, names = ecosystem_module._get_abi_types(abi)
+    assert parsed_types == tuple(ecosystem_module.parse_type(i) for i in inputs)
+    assert names == ("a", "s")
+
+
 def test_decode_returndata(ethereum):
     abi = make_method_abi("doThing", outputs=[{"name": "", "type": "bool"}])
     data = HashBytes32.__eth_pydantic_validate__(0)
@@ -834,6 +864,24 @@ def test_decode_returndata_bool(ethereum):
     assert isinstance(actual, bool)
 
 
+@pytest.mark.parametrize(
+    "output_type,value,expected",
+    [
+        ("uint256[]", (1, 2, 3), [1, 2, 3]),
+        ("int8[2]", (-1, 1), [-1, 1]),
+        ("bytes32[]", (b"\x01" * 32,), [HexBytes(b"\x01" * 32)]),
+        ("bool[]", (True, False), [True, False]),
+        ("uint256[][]", ((1, 2), (3,)), [[1, 2], [3]]),
+    ],
+)
+def test_decode_primitive_value_arrays(ethereum, output_type, value, expected):
+    actual = ethereum.decode_primitive_value(value, output_type)
+    assert actual == expected
+    # Ints come back comparable to currency strings.
+    expected_types = [CurrencyValueComparable if type(v) is int else type(v) for v in expected]
+    assert [type(v) for v in actual] == expected_types
+
+
 @pytest.mark.parametrize("tx_type", TransactionType)
 def test_create_transaction_uses_network_gas_limit(tx_type, ethereum, eth_tester_provider, owner):
     tx = ethereum.create_transaction(type=tx_type.value, sender=owner.address)
@@ -1157,6 +1205,147 @@ def test_enrich_trace_handles_call_type_enum(ethereum, vyper_contract_instance,
     assert actual["call_type"] == CallType.CALL.value
 
 
+def test_enrich_calltree_precompile(ethereum):
+    subcall = {"address": ZERO_ADDRESS, "call_type": "CALL", "calldata": "0x"}
+    call = {
+        "address": "0x0000000000000000000000000000000000000002",
+        "call_type": "STATICCALL",
+        "calldata": "0x1234",
+        "calls": [subcall, {**subcall}],
+    }
+    actual = ethereum._enrich_calltree(call)
+    assert actual["contract_id"] == "2"
+    assert len(actual["calls"]) == 2
+
+
+def test_enrich_calltree_looks_up_each_contract_once(
+    mocker, ethereum, vyper_contract_instance, owner
+):
+    address = vyper_contract_instance.address
+    subcall = {"address": address, "call_type": "STATICCALL", "calldata": "0x", "depth": 1}
+    call = {
+        "address": address,
+        "call_type": "CALL",
+        "calldata": "0x",
+        "calls": [{**subcall}, {**subcall}, {**subcall}],
+    }
+    spy = mocker.spy(ethereum.chain_manager.contracts, "get")
+    actual = ethereum._enrich_calltree(call, sender=owner.address)
+    assert actual["contract_id"] == "VyperContract"
+    assert all(c["contract_id"] == "VyperContract" for c in actual["calls"])
+    assert spy.call_count == 1
+
+
+def test_enrich_calltree_methods(mocker, ethereum, vyper_contract_instance, owner):
+    address = vyper_contract_instance.address
+    method_ids = vyper_contract_instance.contract_type.method_identifiers
+    subcall = {
+        "address": address,
+        "call_type": "STATICCALL",
+        "calldata": method_ids["myNumber()"],
+        "depth": 1,
+    }
+    call = {
+        "address": address,
+        "call_type": "CALL",
+        "calldata": method_ids["myNumber()"],
+        "calls": [{**subcall}, {**subcall}],
+    }
+    spy = mocker.spy(ecosystem_module, "_get_method_abis")
+    actual = ethereum._enrich_calltree(call, sender=owner.address)
+    assert actual["method_id"] == "myNumber"
+    assert all(c["method_id"] == "myNumber" for c in actual["calls"])
+    assert spy.call_count == 1
+
+
+def test_get_token_symbol_cached_on_live_networks(mocker, ethereum, vyper_contract_instance):
+    network = ethereum.provider.network
+    address = vyper_contract_instance.address
+    contract_type = vyper_contract_instance.contract_type
+    call_symbol = mocker.patch.object(type(ethereum), "_call_token_symbol", return_value="TKN")
+
+    # Local networks always make the call.
+    assert ethereum._get_token_symbol(address, contract_type) == "TKN"
+    assert ethereum._get_token_symbol(address, contract_type) == "TKN"
+    assert call_symbol.call_count == 2
+
+    mocker.patch.object(
+        type(network), "is_dev", new_callable=mocker.PropertyMock, return_value=False
+    )
+    call_symbol.reset_mock()
+    try:
+        assert ethereum._get_token_symbol(address, contract_type) == "TKN"
+        assert ethereum._get_token_symbol(address, contract_type) == "TKN"
+        assert call_symbol.call_count == 1
+    finally:
+        ethereum._token_symbols.clear()
+
+
+def test_enrich_value_decodes_each_address_once(mocker, ethereum, vyper_contract_instance):
+    address = vyper_contract_instance.address
+    spy = mocker.spy(type(ethereum), "decode_address")
+    actual = ethereum._enrich_value([address.lower()] * 3, _addresses={})
+    assert actual == ["VyperContract"] * 3
+    assert spy.call_count == 1
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        (b"TKN".ljust(32, b"\x00"), '"TKN"'),
+        ("caf\u00e9 \ufffd".encode("utf8"), '"caf\u00e9 \ufffd"'),
+        (b"\xff" * 32, "0xffff..ffff"),
+        (b"\xff\x01", "0xff01"),
+        # Address.
+        (b"\xff" * 20, "0xFFfFfFffFFfffFFfFFfFFFFFffFFFffffFfFFFfF"),
+    ],
+)
+def test_enrich_value_bytes(ethereum, value, expected):
+    assert ethereum._enrich_value(value) == expected
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("0x" + "ff" * 20, "0xFFfFfFffFFfffFFfFFfFFFFFffFFFffffFfFFFfF"),
+        ("ff" * 20, "0xFFfFfFffFFfffFFfFFfFFFFFffFFFffffFfFFFfF"),
+        ("0x" + "ff" * 19, f'"0x{"ff" * 19}"'),
+        ("not an address", '"not an address"'),
+    ],
+)
+def test_enrich_value_str(ethereum, value, expected):
+    assert ethereum._enrich_value(value) == expected
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ([CurrencyValueComparable(1), CurrencyValueComparable(2)], [1, 2]),
+        ((True, 3), [1, 3]),
+        ([1, b"\xff\x01", "foo"], [1, "0xff01", '"foo"']),
+        ([], []),
+    ],
+)
+def test_enrich_value_sequence(ethereum, value, expected):
+    actual = ethereum._enrich_value(value)
+    assert actual == expected
+    assert [type(v) for v in actual] == [type(v) for v in expected]
+
+
+@pytest.mark.parametrize("as_bytes", (False, True))
+def test_enrich_revert_message(ethereum, as_bytes):
+    # Error(string) for "Unauthorized".
+    returndata = (
+        "0x08c379a0"
+        "0000000000000000000000000000000000000000000000000000000000000020"
+        "000000000000000000000000000000000000000000000000000000000000000c"
+        "556e617574686f72697a65640000000000000000000000000000000000000000"
+    )
+    call = {"returndata": HexBytes(returndata) if as_bytes else returndata}
+    actual = ethereum._enrich_revert_message(call)
+    assert actual["revert_message"] == "Unauthorized"
+
+
 def test_enrich_trace_handles_events(ethereum, vyper_contract_instance, owner):
     tx = vyper_contract_instance.setNumber(96247783, sender=owner)
 
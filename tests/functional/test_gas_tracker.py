@@ -28,3 +28,13 @@ def test_append_gas_transfer(gas_tracker, sender, receiver):
 
     # ETH-transfers are not included in the final report.
     assert report is None
+
+
+def test_merge(gas_tracker):
+    first = {"Contract": {"foo": [1]}}
+    gas_tracker._merge(first)
+    gas_tracker._merge({"Contract": {"foo": [2], "bar": [3]}, "Other": {"baz": [4]}})
+    expected = {"Contract": {"foo": [1, 2], "bar": [3]}, "Other": {"baz": [4]}}
+    assert gas_tracker.session_gas_report == expected
+    # The merged reports are not modified.
+    assert first == {"Contract": {"foo": [1]}}
@@ -1,4 +1,6 @@
+import json
 import os
+import re
 from pathlib import Path
 from unittest import mock
 
@@ -9,6 +11,8 @@ from eth_typing import HexStr
 from eth_utils import ValidationError, to_hex
 from hexbytes import HexBytes
 from requests import HTTPError
+from web3 import HTTPProvider, Web3
+from web3.exceptions import ContractLogicError as Web3ContractLogicError
 from web3.exceptions import ContractPanicError, TimeExhausted
 
 from ape import convert
@@ -22,6 +26,8 @@ from ape.exceptions import (
     UnknownSnapshotError,
 )
 from ape.types.events import LogFilter
+from ape.utils.basemodel import ManagerAccessMixin
+from ape.utils.misc import ZERO_ADDRESS, to_int
 from ape.utils.testing import DEFAULT_TEST_CHAIN_ID
 from ape_ethereum.provider import (
     WEB3_PROVIDER_URI_ENV_VAR_NAME,
@@ -31,6 +37,7 @@ from ape_ethereum.provider import (
 )
 from ape_ethereum.transactions import TransactionStatusEnum, TransactionType
 from ape_test import LocalProvider
+from tests.functional.data.python import TRACE_RESPONSE
 
 
 def test_uri(eth_tester_provider):
@@ -55,6 +62,26 @@ def test_get_block_not_found(eth_tester_provider):
         eth_tester_provider.get_block(block_id)
 
 
+def test_get_block_non_decimal_numeric_str(eth_tester_provider):
+    # NOTE: "²" is numeric but not a decimal ``int()`` can parse.
+    with pytest.raises(BlockNotFoundError):
+        eth_tester_provider.get_block("²")
+
+
+def test_get_block_by_hash_is_cached(eth_tester_provider, vyper_contract_instance):
+    block_hash = eth_tester_provider.get_block("latest").hash
+    expected = eth_tester_provider.get_block(block_hash)
+
+    # Unset `_web3` to show that it is not used in a second call to `get_block`.
+    web3 = eth_tester_provider._web3
+    eth_tester_provider._web3 = None
+    try:
+        assert eth_tester_provider.get_block(block_hash) == expected
+        assert eth_tester_provider.get_block(to_hex(block_hash)) == expected
+    finally:
+        eth_tester_provider._web3 = web3  # Undo
+
+
 def test_get_block_transaction(vyper_contract_instance, owner, eth_tester_provider):
     # Ensure a transaction in latest block
     receipt = vyper_contract_instance.setNumber(900, sender=owner)
@@ -257,6 +284,125 @@ def test_get_contract_logs_single_log(chain, contract_instance, owner, eth_teste
     assert topics == expected_topics
 
 
+@pytest.mark.parametrize("concurrency,batch_count", [(4, 1), (1, 2)])
+def test_get_contract_logs_batched(
+    mocker, chain, contract_instance, owner, eth_tester_provider, concurrency, batch_count
+):
+    contract_instance.fooAndBar(sender=owner)  # Create logs
+    block = chain.blocks.height
+    log_filter = LogFilter.from_event(
+        event=contract_instance.FooHappened,
+        search_topics={"foo": 0},
+        addresses=[contract_instance],
+        start_block=block - 1,
+        stop_block=block,
+    )
+    expected = [log for log in eth_tester_provider.get_contract_logs(log_filter)]
+    get_logs = eth_tester_provider.web3.eth.get_logs
+    mocker.patch.object(
+        type(eth_tester_provider),
+        "http_uri",
+        new_callable=mock.PropertyMock,
+        return_value="http://127.0.0.1:8545",
+    )
+    send_batch = mocker.patch.object(
+        type(eth_tester_provider),
+        "send_batch",
+        side_effect=lambda calls: [get_logs(*params) for _, params in calls],
+    )
+    mocker.patch.object(eth_tester_provider, "block_page_size", 1)
+    mocker.patch.object(eth_tester_provider, "concurrency", concurrency)
+    try:
+        logs = Web3Provider.get_contract_logs(eth_tester_provider, log_filter)
+        actual = [log for log in logs]
+        assert eth_tester_provider._supports_batch_requests is True
+    finally:
+        eth_tester_provider._supports_batch_requests = None
+
+    assert actual == expected
+    assert send_batch.call_count == batch_count
+    # One call per page.
+    assert sum(len(c[0][0]) for c in send_batch.call_args_list) == 2
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        ProviderError("batch not supported"),
+        ProviderError("405 Client Error: Method Not Allowed"),
+        APINotImplementedError(
+            "RPC method 'eth_getLogs' is not implemented by this node instance."
+        ),
+    ],
+)
+def test_get_contract_logs_batch_not_supported(
+    mocker, chain, contract_instance, owner, eth_tester_provider, error
+):
+    contract_instance.fooAndBar(sender=owner)  # Create logs
+    block = chain.blocks.height
+    log_filter = LogFilter.from_event(
+        event=contract_instance.FooHappened,
+        search_topics={"foo": 0},
+        addresses=[contract_instance],
+        start_block=block,
+        stop_block=block,
+    )
+    mocker.patch.object(
+        type(eth_tester_provider),
+        "http_uri",
+        new_callable=mock.PropertyMock,
+        return_value="http://127.0.0.1:8545",
+    )
+    mocker.patch.object(type(eth_tester_provider), "send_batch", side_effect=error)
+    get_logs = eth_tester_provider.web3.eth.get_logs
+    stream_request = mocker.patch.object(
+        type(eth_tester_provider),
+        "stream_request",
+        side_effect=lambda rpc, params: iter(get_logs(*params)),
+    )
+    try:
+        logs = [log for log in Web3Provider.get_contract_logs(eth_tester_provider, log_filter)]
+        assert eth_tester_provider._supports_batch_requests is False
+
+        # Show the worker threads are re-used.
+        pool = eth_tester_provider._log_pool
+        _ = [log for log in Web3Provider.get_contract_logs(eth_tester_provider, log_filter)]
+        assert eth_tester_provider._log_pool is pool
+    finally:
+        eth_tester_provider._supports_batch_requests = None
+
+    assert len(logs) == 1
+    assert logs[0]["foo"] == 0
+    # Falls back to streaming each page.
+    assert stream_request.call_count == 2
+
+
+def test_get_contract_logs_batch_error(mocker, chain, contract_instance, eth_tester_provider):
+    block = chain.blocks.height
+    log_filter = LogFilter.from_event(
+        event=contract_instance.FooHappened,
+        addresses=[contract_instance],
+        start_block=block,
+        stop_block=block,
+    )
+    mocker.patch.object(
+        type(eth_tester_provider),
+        "http_uri",
+        new_callable=mock.PropertyMock,
+        return_value="http://127.0.0.1:8545",
+    )
+    error = ProviderError("query returned more than 10000 results")
+    mocker.patch.object(type(eth_tester_provider), "send_batch", side_effect=error)
+    try:
+        with pytest.raises(ProviderError, match="more than 10000 results"):
+            _ = [log for log in Web3Provider.get_contract_logs(eth_tester_provider, log_filter)]
+
+        # An ordinary RPC error does not mean batching is not supported.
+        assert eth_tester_provider._supports_batch_requests is None
+    finally:
+        eth_tester_provider._supports_batch_requests = None
+
+
 def test_get_contract_logs_single_log_query_multiple_values(
     chain, contract_instance, owner, eth_tester_provider
 ):
@@ -316,6 +462,21 @@ def test_supports_tracing(eth_tester_provider):
     assert not eth_tester_provider.supports_tracing
 
 
+@pytest.mark.parametrize(
+    "modules,expected", [({"eth": "1.0", "debug": "1.0"}, True), ({"eth": "1.0"}, False)]
+)
+def test_supports_tracing_from_rpc_modules(mocker, ethereum, modules, expected):
+    provider = EthereumNodeProvider(name="node", network=ethereum.sepolia)
+    make_request = mocker.patch.object(type(provider), "make_request", return_value=modules)
+    assert provider.supports_tracing is expected
+    assert provider.supports_tracing is expected  # Cached.
+    assert make_request.call_count == 1
+    assert make_request.call_args[0][0] == "rpc_modules"
+
+    provider.disconnect()
+    assert provider._supports_tracing is None
+
+
 def test_get_balance(networks, accounts):
     balance = networks.provider.get_balance(accounts[0].address)
     assert type(balance) is int
@@ -397,6 +558,19 @@ def test_get_code(eth_tester_provider, vyper_contract_instance):
     )
 
 
+def test_get_code_by_block_hash_is_cached(mocker, eth_tester_provider, vyper_contract_instance):
+    address = vyper_contract_instance.address
+    block_hash = to_hex(eth_tester_provider.get_block("latest").hash)
+    code = eth_tester_provider.get_code(address)
+    # NOTE: eth-tester does not support code-by-hash, so the RPC is mocked.
+    get_code_patch = mocker.patch.object(
+        eth_tester_provider.web3.eth, "get_code", return_value=code
+    )
+    assert eth_tester_provider.get_code(address, block_id=block_hash) == code
+    assert eth_tester_provider.get_code(address, block_id=block_hash) == code
+    assert get_code_patch.call_count == 1
+
+
 @pytest.mark.parametrize("tx_type", TransactionType)
 def test_prepare_transaction_with_max_gas(tx_type, eth_tester_provider, ethereum, owner):
     tx = ethereum.create_transaction(type=tx_type.value, sender=owner.address)
@@ -408,6 +582,264 @@ def test_prepare_transaction_with_max_gas(tx_type, eth_tester_provider, ethereum
     assert actual.max_fee is not None
 
 
+def test_get_balances(eth_tester_provider, accounts):
+    addresses = [a.address for a in accounts[:3]]
+    expected = [eth_tester_provider.get_balance(a) for a in addresses]
+    assert eth_tester_provider.get_balances(addresses) == expected
+
+
+def test_get_codes(eth_tester_provider, vyper_contract_instance, owner):
+    addresses = [vyper_contract_instance.address, owner.address]
+    actual = eth_tester_provider.get_codes(addresses)
+    assert actual == [eth_tester_provider.get_code(a) for a in addresses]
+    assert actual[1] == b""
+
+
+def test_prefetch_account(owner, eth_tester_provider):
+    nonce, balance, chain_id, gas_price = eth_tester_provider.prefetch_account(owner.address)
+    assert nonce == owner.nonce
+    assert balance == owner.balance
+    assert chain_id == eth_tester_provider.chain_id
+    assert isinstance(gas_price, int)
+
+
+def test_send_batch(eth_tester_provider, owner):
+    actual = eth_tester_provider.send_batch(
+        [("eth_chainId", []), ("eth_getTransactionCount", [owner.address, "latest"])]
+    )
+    assert to_int(actual[0]) == eth_tester_provider.chain_id
+    assert to_int(actual[1]) == owner.nonce
+
+
+def test_send_batch_http(mocker, eth_tester_provider):
+    mocker.patch.object(
+        type(eth_tester_provider),
+        "http_uri",
+        new_callable=mock.PropertyMock,
+        return_value="http://127.0.0.1:8545",
+    )
+    response = mocker.MagicMock()
+    # NOTE: Responses purposely out-of-order.
+    response.json.return_value = [
+        {"jsonrpc": "2.0", "id": 1, "result": "0x2"},
+        {"jsonrpc": "2.0", "id": 0, "result": "0x1"},
+    ]
+    post = mocker.patch.object(eth_tester_provider.http_session, "post", return_value=response)
+    actual = eth_tester_provider.send_batch([("eth_chainId", []), ("eth_blockNumber", [])])
+    assert actual == ["0x1", "0x2"]
+    assert post.call_count == 1
+    payload = post.call_args[1]["json"]
+    assert [r["method"] for r in payload] == ["eth_chainId", "eth_blockNumber"]
+    assert post.call_args[1]["timeout"] == 30 * 60
+
+
+@pytest.mark.parametrize(
+    "body,message",
+    [
+        (
+            [{"jsonrpc": "2.0", "id": 0, "result": "0x1"}],
+            "Missing batch response for 'eth_blockNumber' (id=1).",
+        ),
+        (
+            [
+                {"jsonrpc": "2.0", "id": 0, "result": "0x1"},
+                {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "Bad"}},
+            ],
+            "Bad",
+        ),
+        ({"jsonrpc": "2.0", "id": 0, "result": "0x1"}, "Expected a list of 2 batch responses."),
+    ],
+)
+def test_send_batch_http_bad_responses(mocker, eth_tester_provider, body, message):
+    mocker.patch.object(
+        type(eth_tester_provider),
+        "http_uri",
+        new_callable=mock.PropertyMock,
+        return_value="http://127.0.0.1:8545",
+    )
+    response = mocker.MagicMock()
+    response.json.return_value = body
+    mocker.patch.object(eth_tester_provider.http_session, "post", return_value=response)
+    with pytest.raises(ProviderError, match=re.escape(message)):
+        eth_tester_provider.send_batch([("eth_chainId", []), ("eth_blockNumber", [])])
+
+
+def test_get_transactions_by_block(vyper_contract_instance, owner, eth_tester_provider):
+    receipt = vyper_contract_instance.setNumber(111, sender=owner)
+    actual = list(eth_tester_provider.get_transactions_by_block(receipt.block_number))
+    assert len(actual) == 1
+    assert to_hex(actual[0].txn_hash) == receipt.txn_hash
+    assert actual[0].receiver == vyper_contract_instance.address
+
+
+def test_send_calls(vyper_contract_instance, eth_tester_provider):
+    txns = [
+        vyper_contract_instance.myNumber.as_transaction(),
+        vyper_contract_instance.getMultipleValues.as_transaction(),
+    ]
+    expected = [eth_tester_provider.send_call(txn) for txn in txns]
+    assert eth_tester_provider.send_calls(txns) == expected
+
+
+def test_send_calls_batched(mocker, vyper_contract_instance, eth_tester_provider):
+    txns = [
+        vyper_contract_instance.myNumber.as_transaction(),
+        vyper_contract_instance.getMultipleValues.as_transaction(),
+    ]
+    expected = [eth_tester_provider.send_call(txn) for txn in txns]
+    mocker.patch.object(
+        type(eth_tester_provider),
+        "http_uri",
+        new_callable=mock.PropertyMock,
+        return_value="http://127.0.0.1:8545",
+    )
+    eth_call = eth_tester_provider.web3.eth.call
+    send_batch = mocker.patch.object(
+        type(eth_tester_provider),
+        "send_batch",
+        side_effect=lambda calls: [eth_call(*params) for _, params in calls],
+    )
+    actual = Web3Provider.send_calls(eth_tester_provider, txns)
+    assert actual == expected
+    assert send_batch.call_count == 1
+    assert [c[0] for c in send_batch.call_args[0][0]] == ["eth_call", "eth_call"]
+
+
+def test_send_calls_tracking_gas(mocker, vyper_contract_instance, eth_tester_provider):
+    txns = [
+        vyper_contract_instance.myNumber.as_transaction(),
+        vyper_contract_instance.getMultipleValues.as_transaction(),
+    ]
+    mocker.patch.object(
+        type(eth_tester_provider),
+        "http_uri",
+        new_callable=mock.PropertyMock,
+        return_value="http://127.0.0.1:8545",
+    )
+    test_runner = mocker.MagicMock()
+    test_runner.gas_tracker.enabled = True
+    mocker.patch.object(ManagerAccessMixin, "_test_runner", test_runner)
+    send_batch = mocker.patch.object(type(eth_tester_provider), "send_batch")
+    send_call = mocker.patch.object(type(eth_tester_provider), "send_call")
+
+    # The calls are made individually so their gas is tracked.
+    Web3Provider.send_calls(eth_tester_provider, txns)
+    assert send_batch.call_count == 0
+    assert send_call.call_count == 2
+
+
+def test_eth_call_over_http(mocker, ethereum, vyper_contract_instance):
+    provider = EthereumNodeProvider(name="node", network=ethereum.sepolia)
+    provider._web3 = Web3(HTTPProvider("http://127.0.0.1:8545"))
+    response = mocker.MagicMock()
+    response.json.return_value = {"jsonrpc": "2.0", "id": 0, "result": "0x0123"}
+    post = mocker.patch.object(type(provider.http_session), "post", return_value=response)
+    arguments = [{"to": vyper_contract_instance.address, "data": "0x23fd0e40"}, "latest"]
+
+    actual = provider._eth_call(arguments)
+    assert actual == HexBytes("0x0123")
+    body = post.call_args[1]["data"]
+    assert json.loads(body) == {
+        "jsonrpc": "2.0",
+        "id": 0,
+        "method": "eth_call",
+        "params": arguments,
+    }
+    assert post.call_args[1]["timeout"] == 30 * 60
+
+
+def test_gas_price_cached_on_live_network(mocker, eth_tester_provider):
+    mocker.patch.object(
+        type(eth_tester_provider.network),
+        "is_dev",
+        new_callable=mock.PropertyMock,
+        return_value=False,
+    )
+    getter = mocker.patch.object(type(eth_tester_provider), "_get_gas_price", return_value=123)
+    try:
+        assert Web3Provider.gas_price.fget(eth_tester_provider) == 123
+        assert Web3Provider.gas_price.fget(eth_tester_provider) == 123
+    finally:
+        eth_tester_provider._gas_cache = {}
+
+    assert getter.call_count == 1
+
+
+def test_stream_request_error(mocker, eth_tester_provider):
+    mocker.patch.object(
+        type(eth_tester_provider),
+        "http_uri",
+        new_callable=mock.PropertyMock,
+        return_value="http://127.0.0.1:8545",
+    )
+    response = mocker.MagicMock()
+    response.iter_content.return_value = [
+        b'{"jsonrpc": "2.0", "id": 1, "error": {"code": -32005, "message": "too many logs"}}'
+    ]
+    mocker.patch.object(eth_tester_provider.http_session, "post", return_value=response)
+    with pytest.raises(ProviderError, match="too many logs"):
+        _ = [x for x in eth_tester_provider.stream_request("eth_getLogs", [{}])]
+
+
+def test_latest_block_cached_on_live_network(mocker, eth_tester_provider):
+    mocker.patch.object(
+        type(eth_tester_provider.network),
+        "is_dev",
+        new_callable=mock.PropertyMock,
+        return_value=False,
+    )
+    block_data = {"number": "0x5", "hash": "0x" + "ab" * 32, "gasLimit": "0x1c9c380"}
+    make_request = mocker.patch.object(
+        type(eth_tester_provider), "make_request", return_value=block_data
+    )
+    try:
+        first = Web3Provider._get_latest_block_rpc(eth_tester_provider)
+        first["number"] = "0x6"  # Callers modifying the data do not affect the cache.
+        assert Web3Provider._get_latest_block_rpc(eth_tester_provider)["number"] == "0x5"
+        assert make_request.call_count == 1
+    finally:
+        eth_tester_provider._latest_block_cache = None
+
+
+def test_disconnect_clears_rpc_caches(ethereum):
+    provider = EthereumNodeProvider(name="node", network=ethereum.sepolia)
+    provider._gas_cache = {"gas_price": (0.0, 1)}
+    provider._latest_block_cache = (0.0, {}, None)
+    pool = provider._get_log_pool()
+    assert provider._log_pool_size == provider.concurrency
+
+    provider.disconnect()
+    assert provider._gas_cache == {}
+    assert provider._latest_block_cache is None
+    assert provider._log_pool is None
+    assert pool._shutdown
+
+
+def test_http_session(eth_tester_provider):
+    session = eth_tester_provider.http_session
+    assert eth_tester_provider.http_session is session  # Cached.
+    adapter = session.get_adapter("https://example.com")
+    assert adapter._pool_maxsize == eth_tester_provider.concurrency * 4
+    # Fail fast when the node is not up (e.g. polling at start-up).
+    assert adapter.max_retries.connect == 0
+    assert "User-Agent" in session.headers
+
+
+def test_http_session_request_headers(project, networks):
+    config = {
+        "request_headers": {"h0": "0"},
+        "ethereum": {"request_headers": {"h1": "1"}, "local": {"request_headers": {"h2": "2"}}},
+        "test": {"request_headers": {"h3": "3"}},
+    }
+    with project.temp_config(**config):
+        provider = networks.ethereum.local.get_provider("test")
+        headers = provider.http_session.headers
+        assert headers["h0"] == "0"  # top-level
+        assert headers["h1"] == "1"  # ecosystem
+        assert headers["h2"] == "2"  # network
+        assert headers["h3"] == "3"  # provider
+
+
 def test_no_comma_in_rpc_url():
     test_url = "URI: http://127.0.0.1:8545,"
     sanitised_url = _sanitize_web3_url(test_url)
@@ -458,6 +890,25 @@ def test_send_transaction_when_no_error_and_receipt_fails(
         eth_tester_provider.__dict__["tester"] = original_tester
 
 
+def test_send_transaction_does_not_replay_known_revert(
+    mocker, eth_tester_provider, not_owner, vyper_contract_instance
+):
+    txn = vyper_contract_instance.setNumber.as_transaction(5, sender=not_owner)
+    txn = not_owner.sign_transaction(not_owner.prepare_transaction(txn))
+    txn.raise_on_revert = False
+    mocker.patch.object(
+        type(eth_tester_provider),
+        "_send_transaction",
+        side_effect=Web3ContractLogicError("execution reverted: !authorized"),
+    )
+    eth_call = mocker.patch.object(type(eth_tester_provider.web3.eth), "call")
+
+    receipt = Web3Provider.send_transaction(eth_tester_provider, txn)
+    assert receipt.failed
+    assert isinstance(receipt.error, ContractLogicError)
+    assert eth_call.call_count == 0
+
+
 def test_network_choice(eth_tester_provider):
     actual = eth_tester_provider.network_choice
     expected = "ethereum:local:test"
@@ -728,6 +1179,13 @@ def test_update_settings_invalidates_snapshots(eth_tester_provider, chain):
     assert snapshot not in chain._snapshots[eth_tester_provider.chain_id]
 
 
+def test_set_web3_uses_http_session(mocker, ethereum):
+    web3_factory_patch = mocker.patch("ape_ethereum.provider._create_web3")
+    provider = EthereumNodeProvider(name="node", network=ethereum.sepolia)
+    provider._set_web3()
+    assert web3_factory_patch.call_args[1]["session"] is provider.http_session
+
+
 def test_connect_uses_cached_chain_id(mocker, mock_web3, ethereum, eth_tester_provider):
     class PluginProvider(EthereumNodeProvider):
         pass
@@ -755,3 +1213,28 @@ def test_connect_uses_cached_chain_id(mocker, mock_web3, ethereum, eth_tester_pr
     provider.connect()
     # It is still cached from the previous connection.
     assert chain_id_tracker.call_count == 1
+
+
+def test_get_transaction_traces_by_block(mocker, eth_tester_provider):
+    txn_hashes = [f"0x{str(n) * 64}" for n in (1, 2)]
+    frames = [{**TRACE_RESPONSE["result"][0], "transactionHash": h} for h in txn_hashes]
+    reward = {"action": {"author": ZERO_ADDRESS, "value": "0x0"}, "type": "reward"}
+    make_request = mocker.patch.object(
+        type(eth_tester_provider), "make_request", return_value=[*frames, reward]
+    )
+    # NOTE: Earlier traces remember the approach that worked for them on the provider.
+    mocker.patch.object(eth_tester_provider, "_call_trace_approach", None)
+    try:
+        traces = list(Web3Provider.get_transaction_traces_by_block(eth_tester_provider, 123))
+        assert [t.transaction_hash for t in traces] == txn_hashes
+        make_request.assert_called_once_with("trace_block", ["0x7b"])
+
+        # Show the block's frames are used rather than tracing each transaction again.
+        calltree = traces[0].get_calltree()
+        assert calltree.address == HexBytes(frames[0]["action"]["to"])
+        assert make_request.call_count == 1
+        assert Web3Provider.get_transaction_trace(eth_tester_provider, txn_hashes[1]) is traces[1]
+
+    finally:
+        for txn_hash in txn_hashes:
+            eth_tester_provider._transaction_trace_cache.pop(txn_hash, None)
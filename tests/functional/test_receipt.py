@@ -6,6 +6,7 @@ from rich.table import Table
 from rich.tree import Tree
 
 from ape.exceptions import ContractLogicError, OutOfGasError
+from ape.logging import LogLevel, logger
 from ape.utils import ManagerAccessMixin
 from ape_ethereum.transactions import DynamicFeeTransaction, Receipt, TransactionStatusEnum
 
@@ -250,6 +251,36 @@ def test_receipt_chain_id(invoke_receipt, eth_tester_provider):
     assert invoke_receipt.chain_id == eth_tester_provider.chain_id
 
 
+def test_await_sender_nonce_increment_backs_off(mocker, invoke_receipt, eth_tester_provider):
+    nonce = invoke_receipt.nonce
+    get_nonce = mocker.patch.object(
+        type(eth_tester_provider), "get_nonce", side_effect=[nonce, nonce, nonce, nonce + 1]
+    )
+    sleep = mocker.patch("ape.api.transactions.time.sleep")
+    invoke_receipt._await_sender_nonce_increment()
+    assert get_nonce.call_count == 4
+    assert [c.args[0] for c in sleep.call_args_list] == [0.25, 0.5, 1]
+
+
+def test_log_submission_skips_explorer_when_not_shown(mocker, invoke_receipt):
+    explorer = mocker.MagicMock()
+    explorer.get_transaction_url.return_value = "https://explorer.example/tx/0x123"
+    invoke_receipt.__dict__["_explorer"] = explorer
+    try:
+        with logger.at_level(LogLevel.WARNING):
+            invoke_receipt._log_submission()
+
+        assert explorer.get_transaction_url.call_count == 0
+
+        with logger.at_level(LogLevel.INFO):
+            invoke_receipt._log_submission()
+
+        explorer.get_transaction_url.assert_called_once_with(invoke_receipt.txn_hash)
+
+    finally:
+        invoke_receipt.__dict__.pop("_explorer", None)
+
+
 def test_track_coverage(deploy_receipt, mocker):
     """
     Show that deploy receipts are not tracked.
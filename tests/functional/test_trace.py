@@ -1,11 +1,20 @@
 import json
 import re
+import sys
 
 import pytest
 from evm_trace import CallTreeNode, CallType
 from hexbytes import HexBytes
 
-from ape_ethereum.trace import CallTrace, Trace, TraceApproach, TransactionTrace, parse_rich_tree
+from ape.types.trace import ContractFunctionPath
+from ape_ethereum.trace import (
+    CallTrace,
+    Trace,
+    TraceApproach,
+    TransactionTrace,
+    _str_len_exceeds,
+    parse_rich_tree,
+)
 from tests.functional.data.python import (
     TRACE_MISSING_GAS,
     TRACE_WITH_CUSTOM_ERROR,
@@ -100,6 +109,24 @@ def test_parse_rich_tree_handle_bad_event_data():
     assert len(tree.children) == 0
 
 
+def test_parse_rich_tree_deep_calltree():
+    depth = sys.getrecursionlimit() + 100
+    call: dict = {"contract_id": "Contract", "method_id": "method", "call_type": "CALL"}
+    root = call
+    for _ in range(depth):
+        sub_call = {**call, "calls": []}
+        call["calls"] = [sub_call]
+        call = sub_call
+
+    tree = parse_rich_tree(root)
+    actual = 0
+    while tree.children:
+        tree = tree.children[0].label  # type: ignore
+        actual += 1
+
+    assert actual == depth
+
+
 def test_get_gas_report(gas_tracker, owner, vyper_contract_instance):
     tx = vyper_contract_instance.setNumber(924, sender=owner)
     trace = tx.trace
@@ -133,6 +160,99 @@ def test_get_gas_report_with_sub_calls(simple_trace_cls):
     assert len(actual) > 1  # Sub-contract calls!
 
 
+def test_get_gas_report_exclude(simple_trace_cls):
+    trace_cls = simple_trace_cls(PASSING_TRACE_LARGE)
+    trace = trace_cls.model_validate(TRACE_API_DATA)
+    report = trace.get_gas_report()
+    contract_id = next(iter(report))
+    method_id = next(iter(report[contract_id]))
+
+    exclude = [ContractFunctionPath.from_str(f"{contract_id}:{method_id}")]
+    actual = trace.get_gas_report(exclude=exclude)
+    assert method_id not in actual.get(contract_id, {})
+
+    exclude = [ContractFunctionPath.from_str(f"{contract_id[:2]}*")]
+    actual = trace.get_gas_report(exclude=exclude)
+    assert contract_id not in actual
+
+
+def test_get_gas_report_exclude_contract_reports_sub_calls(simple_trace_cls):
+    trace_cls = simple_trace_cls(PASSING_TRACE)
+    trace = trace_cls.model_validate(TRACE_API_DATA)
+    call = {
+        "contract_id": "Router",
+        "method_id": "swap",
+        "gas_cost": 300,
+        "calls": [
+            {"contract_id": "Token", "method_id": "transfer", "gas_cost": 100},
+            {"contract_id": "Router", "method_id": "quote", "gas_cost": 50},
+            {"contract_id": "Token", "method_id": "transfer", "gas_cost": 101},
+        ],
+    }
+    exclude = [ContractFunctionPath.from_str("Rout*")]
+    actual = trace._get_gas_report_from_call(call, exclude=exclude)
+    assert actual == {"Token": {"transfer": [100, 101]}}
+
+
+def test_get_gas_report_transfers(mocker, simple_trace_cls, accounts):
+    receiver = "0x" + "12" * 20
+    trace_cls = simple_trace_cls(PASSING_TRACE, tx={"to": receiver})
+    trace = trace_cls.model_validate(TRACE_API_DATA)
+    transfer = {"contract_id": "__ETH_transfer__", "method_id": "0x", "gas_cost": 1}
+    call = {
+        "contract_id": "Contract",
+        "method_id": "payout",
+        "gas_cost": 10,
+        "calls": [{**transfer}, {**transfer, "gas_cost": 2}],
+    }
+    spy = mocker.spy(type(accounts), "__contains__")
+    actual = trace._get_gas_report_from_call(call)
+    expected = {
+        "__ETH_transfer__": {f"to:{receiver}": [1, 2]},
+        "Contract": {"payout": [10]},
+    }
+    assert actual == expected
+    # Only checks the accounts for the first transfer.
+    assert spy.call_count == 1
+
+
+def test_get_gas_report_cached(mocker, simple_trace_cls):
+    trace_cls = simple_trace_cls(PASSING_TRACE_LARGE)
+    trace = trace_cls.model_validate(TRACE_API_DATA)
+    spy = mocker.spy(trace_cls, "_get_gas_report_from_call")
+    expected = trace.get_gas_report()
+
+    # Mutating the result should not affect the next one.
+    contract_id = next(iter(expected))
+    method_id = next(iter(expected[contract_id]))
+    expected[contract_id][method_id].append(123)
+    actual = trace.get_gas_report()
+    assert actual[contract_id][method_id] == expected[contract_id][method_id][:-1]
+    assert spy.call_count == 1
+
+    exclude = [ContractFunctionPath.from_str(f"{contract_id}:{method_id}")]
+    trace.get_gas_report(exclude=exclude)
+    trace.get_gas_report(exclude=exclude)
+    assert spy.call_count == 2
+
+
+def test_get_gas_report_deep_calltree(simple_trace_cls):
+    depth = sys.getrecursionlimit() + 100
+    trace_cls = simple_trace_cls(PASSING_TRACE)
+    trace = trace_cls.model_validate(TRACE_API_DATA)
+    root: dict = {"contract_id": "Contract", "method_id": "method", "gas_cost": 0}
+    call = root
+    for gas_cost in range(1, depth + 1):
+        sub_call = {"contract_id": "Contract", "method_id": "method", "gas_cost": gas_cost}
+        call["calls"] = [sub_call]
+        call = sub_call
+
+    actual = trace._get_gas_report_from_call(root)
+    # Sub-calls are reported before their callers.
+    expected = {"Contract": {"method": list(range(depth, -1, -1))}}
+    assert actual == expected
+
+
 @pytest.mark.parametrize("txn_hash_callback", (str, HexBytes))
 def test_transaction_trace_create(vyper_contract_instance, txn_hash_callback):
     tx_hash = txn_hash_callback(vyper_contract_instance.creation_metadata.txn_hash)
@@ -142,6 +262,20 @@ def test_transaction_trace_create(vyper_contract_instance, txn_hash_callback):
     assert re.match(expected, actual)
 
 
+def test_transaction_trace_raw_trace_frames_streams_once(mocker):
+    frames = [{"pc": 0, "op": "PUSH1"}, {"pc": 2, "op": "PUSH1"}, {"pc": 4, "op": "STOP"}]
+    stream = mocker.patch.object(
+        TransactionTrace, "_stream_struct_logs", side_effect=lambda: iter(frames)
+    )
+    trace = TransactionTrace(transaction_hash="0x" + "01" * 32)
+
+    # Partially consume, then iterate fully (more than once).
+    assert next(trace.raw_trace_frames) == frames[0]
+    assert list(trace.raw_trace_frames) == frames
+    assert list(trace.raw_trace_frames) == frames
+    assert stream.call_count == 1
+
+
 def test_transaction_trace_multiline(vyper_contract_instance, owner):
     tx = vyper_contract_instance.getNestedAddressArray.transact(sender=owner)
     actual = f"{tx.trace}"
@@ -352,3 +486,20 @@ class TestTraceApproach:
     def test_from_key_parity(self):
         actual = TraceApproach.from_key("parity")
         assert actual == TraceApproach.PARITY
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        [],
+        (),
+        (1,),
+        list(range(100)),
+        tuple(range(100)),
+        [[1, 2], (3,), ["a'b", b"\x00"]] * 10,
+        [(i, str(i)) for i in range(30)],
+    ],
+)
+def test_str_len_exceeds(value):
+    for limit in (0, 10, 49, 50, 100, 1_000):
+        assert _str_len_exceeds(value, limit) == (len(str(value)) > limit)
@@ -307,6 +307,16 @@ def test_str_when_data_is_bytes(ethereum):
     assert isinstance(actual, str)
 
 
+def test_str_when_data_is_large(ethereum):
+    txn = ethereum.create_transaction(data=HexBytes(b"\x60\x80" * 1000))
+    actual = str(txn)
+    lines = actual.splitlines()
+    assert "  data: 0x307836...303830" in lines
+    # Data shows in its declared position.
+    assert lines.index("  value: 0") < lines.index("  data: 0x307836...303830")
+    assert lines.index("  data: 0x307836...303830") < lines.index("  type: 2")
+
+
 def test_receipt_when_none(ethereum):
     txn = ethereum.create_transaction(data=HexBytes("0x123"))
     assert txn.receipt is None
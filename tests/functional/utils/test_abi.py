@@ -2,10 +2,11 @@ import pickle
 from copy import deepcopy
 
 import pytest
+from eth_abi import decode, encode
 from eth_pydantic_types import HexBytes
 from ethpm_types.abi import ABIType, EventABI, EventABIType
 
-from ape.utils.abi import LogInputABICollection, create_struct
+from ape.utils.abi import LogInputABICollection, _get_tuple_decoder, create_struct, decode_abi
 
 
 @pytest.fixture
@@ -65,6 +66,20 @@ def log_data_missing_trailing_zeroes():
     )
 
 
+@pytest.mark.parametrize("strict", (True, False))
+def test_decode_abi(strict):
+    types = ["uint256", "address", "string", "(uint8,bytes)[]"]
+    values = (5, "0x" + "11" * 20, "hello", [(3, b"ab")])
+    data = encode(types, values)
+    expected = decode(types, data, strict=strict)
+
+    assert decode_abi(types, data, strict=strict) == expected
+    # The decoder is re-used for the same types.
+    cache_info = _get_tuple_decoder.cache_info()
+    assert decode_abi(types, data, strict=strict) == expected
+    assert _get_tuple_decoder.cache_info().hits == cache_info.hits + 1
+
+
 def test_decode_data_missing_trailing_zeroes(
     collection, topics, log_data_missing_trailing_zeroes, ape_caplog
 ):
@@ -114,6 +129,44 @@ def test_decode_topics_missing_leading_zeroes(vyper_contract_type):
     assert actual["newNum"] == 321  # NOTE: Was a bug where this causes issues.
 
 
+def test_decode_static_words():
+    abi = EventABI(
+        type="event",
+        name="Transfer",
+        inputs=[
+            EventABIType(name="sender", type="address", indexed=True),
+            EventABIType(name="amount", type="uint256", indexed=False),
+            EventABIType(name="delta", type="int8", indexed=False),
+            EventABIType(name="flag", type="bool", indexed=False),
+            EventABIType(name="salt", type="bytes32", indexed=False),
+        ],
+    )
+    topics = [
+        "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef",
+        "0x000000000000000000000000f39fd6e51aad88f6f4ce6ab8827279cfffb92266",
+    ]
+    data = (
+        (123).to_bytes(32, "big")
+        + (-5).to_bytes(32, "big", signed=True)
+        + (1).to_bytes(32, "big")
+        + b"\x01" * 32
+    )
+    collection = LogInputABICollection(abi)
+    assert collection._word_decoders is not None
+
+    actual = collection.decode(topics, data)
+    collection._word_decoders = None
+    expected = collection.decode(topics, data)
+    assert actual == expected
+    assert actual == {
+        "sender": "0xf39fd6e51aad88f6f4ce6ab8827279cfffb92266",
+        "amount": 123,
+        "delta": -5,
+        "flag": True,
+        "salt": HexBytes(b"\x01" * 32),
+    }
+
+
 class TestStruct:
     @pytest.fixture
     def struct(self):
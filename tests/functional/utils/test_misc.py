@@ -1,4 +1,7 @@
 import asyncio
+import gc
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 from eth_pydantic_types import HexBytes
@@ -94,6 +97,31 @@ def test_run_until_complete_multiple_coroutines():
     assert actual == [3, 4]
 
 
+def test_run_until_complete_in_thread():
+    async def foo():
+        return 3
+
+    with ThreadPoolExecutor(1) as pool:
+        actual = pool.submit(run_until_complete, foo()).result()
+
+    assert actual == 3
+
+
+def test_run_until_complete_closes_thread_loop():
+    loops = []
+
+    async def foo():
+        loops.append(asyncio.get_running_loop())
+
+    thread = threading.Thread(target=run_until_complete, args=(foo(),))
+    thread.start()
+    thread.join()
+    gc.collect()
+
+    # The thread's loop is closed once the thread is gone.
+    assert loops[0].is_closed()
+
+
 @pytest.mark.parametrize("addresses", [(f"0x{i}", f"0x{'0' * 39}{i}") for i in range(1, 10)])
 def test_is_evm_precompile(addresses):
     for addr in addresses:
@@ -104,6 +132,7 @@ def test_is_not_evm_precompile(zero_address, owner):
     assert not is_evm_precompile(zero_address)
     assert not is_evm_precompile(owner.address)
     assert not is_evm_precompile("MyContract")
+    assert not is_evm_precompile("0xa9059cbb")  # A method ID.
 
 
 @pytest.mark.parametrize("addr", (ZERO_ADDRESS, "0x", "0x0"))
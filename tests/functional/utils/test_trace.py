@@ -0,0 +1,47 @@
+import pytest
+
+from ape.types.trace import ContractFunctionPath
+from ape.utils.trace import _exclude_gas, parse_gas_table
+
+EXCLUSIONS = [
+    ContractFunctionPath.from_str("Tok*:trans*"),
+    ContractFunctionPath.from_str("Vault"),
+    ContractFunctionPath.from_str("*Router*:swap?"),
+]
+
+
+@pytest.mark.parametrize(
+    "contract_id,method_id,expected",
+    [
+        ("Token", "transfer", True),
+        ("Token", "approve", False),
+        ("Vault", "deposit", True),
+        ("VaultV2", "deposit", False),
+        ("MyRouterV2", "swapA", True),
+        ("MyRouterV2", "swapAB", False),
+        ("MyContract", "setNumber", False),
+        ("Token", "", False),
+        ("Vault", "", True),
+    ],
+)
+def test_exclude_gas(contract_id, method_id, expected):
+    assert _exclude_gas(EXCLUSIONS, contract_id, method_id) is expected
+
+
+def test_exclude_gas_contract_pattern_does_not_match_method():
+    # The contract pattern must only match the contract ID, not the method part.
+    exclusions = [ContractFunctionPath.from_str("*fer")]
+    assert not _exclude_gas(exclusions, "Token", "transfer")
+    assert _exclude_gas(exclusions, "Transfer", "send")
+    assert not _exclude_gas([], "Token", "transfer")
+
+
+def test_parse_gas_table():
+    report = {"Token": {"transfer": [100, 101, 103, 110], "approve": [], "__new__": [5]}}
+    (table,) = parse_gas_table(report)
+    assert table.title == "Token Gas"
+    rows = list(zip(*[c._cells for c in table.columns]))
+    assert rows == [
+        ("__init__", "1", "5", "5", "5", "5"),
+        ("transfer", "4", "100", "110", "104", "102"),
+    ]